@@ -37,6 +37,8 @@ namespace MCPForUnity.Editor.Tools
             bool failFast = @params.Value<bool?>("failFast") ?? false;
             bool parallelRequested = @params.Value<bool?>("parallel") ?? false;
             int? maxParallel = @params.Value<int?>("maxParallelism");
+            // Server-side coalescing forwards params already shaped for the target handler.
+            bool normalizeKeys = @params.Value<bool?>("normalizeKeys") ?? true;
 
             if (parallelRequested)
             {
@@ -69,7 +71,7 @@ namespace MCPForUnity.Editor.Tools
 
                 string toolName = commandObj["tool"]?.ToString();
                 var rawParams = commandObj["params"] as JObject ?? new JObject();
-                var commandParams = NormalizeParameterKeys(rawParams);
+                var commandParams = normalizeKeys ? NormalizeParameterKeys(rawParams) : rawParams;
 
                 if (string.IsNullOrWhiteSpace(toolName))
                 {
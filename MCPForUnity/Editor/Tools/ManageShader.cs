@@ -132,15 +132,6 @@ namespace MCPForUnity.Editor.Tools
             return System.Text.Encoding.UTF8.GetString(data);
         }
 
-        /// <summary>
-        /// Encode text to base64 string
-        /// </summary>
-        private static string EncodeBase64(string text)
-        {
-            byte[] data = System.Text.Encoding.UTF8.GetBytes(text);
-            return Convert.ToBase64String(data);
-        }
-
         private static object CreateShader(
             string fullPath,
             string relativePath,
@@ -197,16 +188,12 @@ namespace MCPForUnity.Editor.Tools
             {
                 string contents = File.ReadAllText(fullPath);
 
-                // Return both normal and encoded contents for larger files
-                //TODO: Consider a threshold for large files
-                bool isLarge = contents.Length > 10000; // If content is large, include encoded version
+                // Plain contents only: JSON already escapes shader source safely, and a
+                // base64 duplicate would more than double the payload for large files.
                 var responseData = new
                 {
                     path = relativePath,
                     contents = contents,
-                    // For large files, also include base64-encoded version
-                    encodedContents = isLarge ? EncodeBase64(contents) : null,
-                    contentsEncoded = isLarge,
                 };
 
                 return new SuccessResponse(
@@ -1,3 +1,4 @@
+using System;
 using System.Collections.Generic;
 using MCPForUnity.Editor.Helpers;
 using Newtonsoft.Json.Linq;
@@ -13,13 +14,23 @@ namespace MCPForUnity.Editor.Tools.Vfx
             LineRenderer lr = LineRead.FindLineRenderer(@params);
             if (lr == null) return new { success = false, message = "LineRenderer not found" };
 
-            JArray posArr = @params["positions"] as JArray;
-            if (posArr == null) return new { success = false, message = "Positions array required" };
-
-            var positions = new Vector3[posArr.Count];
-            for (int i = 0; i < posArr.Count; i++)
+            Vector3[] positions;
+            string packed = @params["positionsBin"]?.ToString();
+            if (!string.IsNullOrEmpty(packed))
+            {
+                positions = DecodePackedPositions(packed);
+                if (positions == null) return new { success = false, message = "positionsBin must be base64 little-endian float32 x,y,z triples" };
+            }
+            else
             {
-                positions[i] = ManageVfxCommon.ParseVector3(posArr[i]);
+                JArray posArr = @params["positions"] as JArray;
+                if (posArr == null) return new { success = false, message = "Positions array required" };
+
+                positions = new Vector3[posArr.Count];
+                for (int i = 0; i < posArr.Count; i++)
+                {
+                    positions[i] = ManageVfxCommon.ParseVector3(posArr[i]);
+                }
             }
 
             Undo.RecordObject(lr, "Set Line Positions");
@@ -30,6 +41,32 @@ namespace MCPForUnity.Editor.Tools.Vfx
             return new { success = true, message = $"Set {positions.Length} positions" };
         }
 
+        // Long position lists are sent packed by the server (see _pack_positions in manage_vfx.py)
+        // so they skip per-element JSON parsing. Editor platforms are little-endian.
+        private static Vector3[] DecodePackedPositions(string encoded)
+        {
+            byte[] bytes;
+            try
+            {
+                bytes = Convert.FromBase64String(encoded);
+            }
+            catch (FormatException)
+            {
+                return null;
+            }
+            if (bytes.Length % (3 * sizeof(float)) != 0) return null;
+
+            var floats = new float[bytes.Length / sizeof(float)];
+            Buffer.BlockCopy(bytes, 0, floats, 0, bytes.Length);
+
+            var positions = new Vector3[floats.Length / 3];
+            for (int i = 0; i < positions.Length; i++)
+            {
+                positions[i] = new Vector3(floats[3 * i], floats[3 * i + 1], floats[3 * i + 2]);
+            }
+            return positions;
+        }
+
         public static object AddPosition(JObject @params)
         {
             LineRenderer lr = LineRead.FindLineRenderer(@params);
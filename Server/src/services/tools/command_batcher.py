@@ -0,0 +1,127 @@
+"""Coalesce bursts of same-tool commands into a single batch_execute round-trip to Unity."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from typing import Any, Awaitable, Callable
+
+import transport.unity_transport as unity_transport
+from services.tools.batch_execute import MAX_COMMANDS_PER_BATCH
+
+logger = logging.getLogger("mcp-for-unity-server")
+
+
+def _batch_window_s() -> float:
+    """Coalescing window from UNITY_MCP_BATCH_WINDOW_MS; 0 (the default) disables batching."""
+    raw_val = os.environ.get("UNITY_MCP_BATCH_WINDOW_MS", "0")
+    try:
+        window_ms = float(raw_val)
+    except ValueError:
+        logger.warning(
+            "Invalid UNITY_MCP_BATCH_WINDOW_MS=%r, batching disabled", raw_val)
+        return 0.0
+    # Clamp to [0, 100] so a misconfiguration cannot stall every tool call.
+    return max(0.0, min(window_ms, 100.0)) / 1000.0
+
+
+class CommandBatcher:
+    """
+    Collects commands for one Unity tool that arrive within a short window and sends them
+    as a single batch_execute command, resolving each caller with its own result.
+
+    Unity runs batched commands sequentially in arrival order, so per-instance ordering is
+    preserved. With the window disabled, send() is a plain send_with_unity_instance call.
+    """
+
+    def __init__(self, command_type: str):
+        self._command_type = command_type
+        self._pending: dict[str | None,
+                            list[tuple[dict[str, Any], asyncio.Future]]] = {}
+        self._flush_tasks: set[asyncio.Task] = set()
+
+    async def send(
+        self,
+        send_fn: Callable[..., Awaitable[Any]],
+        unity_instance: str | None,
+        params: dict[str, Any],
+    ) -> dict[str, Any]:
+        window_s = _batch_window_s()
+        if window_s <= 0:
+            return await unity_transport.send_with_unity_instance(
+                send_fn, unity_instance, self._command_type, params)
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        bucket = self._pending.get(unity_instance)
+        if bucket is None:
+            bucket = self._pending[unity_instance] = []
+            task = loop.create_task(self._flush_after(
+                send_fn, unity_instance, window_s))
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+        bucket.append((params, future))
+        return await future
+
+    async def _flush_after(
+        self,
+        send_fn: Callable[..., Awaitable[Any]],
+        unity_instance: str | None,
+        window_s: float,
+    ) -> None:
+        await asyncio.sleep(window_s)
+        bucket = self._pending.pop(unity_instance, [])
+        for start in range(0, len(bucket), MAX_COMMANDS_PER_BATCH):
+            chunk = bucket[start:start + MAX_COMMANDS_PER_BATCH]
+            try:
+                results = await self._send_chunk(
+                    send_fn, unity_instance, [params for params, _ in chunk])
+            except Exception as exc:
+                for _, future in chunk:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+            for (_, future), result in zip(chunk, results):
+                if not future.done():
+                    future.set_result(result)
+
+    async def _send_chunk(
+        self,
+        send_fn: Callable[..., Awaitable[Any]],
+        unity_instance: str | None,
+        params_list: list[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        if len(params_list) == 1:
+            return [await unity_transport.send_with_unity_instance(
+                send_fn, unity_instance, self._command_type, params_list[0])]
+
+        response = await unity_transport.send_with_unity_instance(
+            send_fn,
+            unity_instance,
+            "batch_execute",
+            {
+                "commands": [{"tool": self._command_type, "params": params} for params in params_list],
+                # Tool params are already in the shape the handler expects; don't camelCase them again.
+                "normalizeKeys": False,
+            },
+        )
+
+        data = response.get("data") if isinstance(response, dict) else None
+        results = data.get("results") if isinstance(data, dict) else None
+        if not isinstance(results, list):
+            # The batch itself failed (disconnect, reload, ...): every caller sees that failure,
+            # each in its own dict since tools may fill in defaults on the envelope they get.
+            return [dict(response) for _ in params_list]
+
+        unpacked: list[dict[str, Any]] = []
+        for index in range(len(params_list)):
+            entry = results[index] if index < len(results) else None
+            if isinstance(entry, dict) and "result" in entry:
+                result = entry["result"]
+                # Handler output skips send_with_unity_instance, so coerce it to a dict the same way.
+                unpacked.append(unity_transport._as_response_dict(result)
+                                if result is not None else {"success": True})
+            else:
+                error = entry.get("error") if isinstance(entry, dict) else None
+                unpacked.append({"success": False, "message": error or "Command was not executed by batch_execute."})
+        return unpacked
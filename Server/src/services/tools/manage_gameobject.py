@@ -1,5 +1,4 @@
-import json
-import math
+from math import isfinite
 from typing import Annotated, Any, Literal
 
 from fastmcp import Context
@@ -7,10 +6,55 @@ from mcp.types import ToolAnnotations
 
 from services.registry import mcp_for_unity_tool
 from services.tools import get_unity_instance_from_context
-from transport.unity_transport import send_with_unity_instance
 from transport.legacy.unity_connection import async_send_command_with_retry
 from services.tools.utils import coerce_bool, parse_json_payload, coerce_int
 from services.tools.preflight import preflight
+from services.tools.command_batcher import CommandBatcher
+
+
+_batcher = CommandBatcher("manage_gameobject")
+
+# Keys of the success envelope this tool returns; Unity responses with only these keys are returned as-is.
+_OK_ENVELOPE_KEYS = frozenset(("success", "message", "data"))
+
+# Actions that address the target GameObject by 'name' rather than 'search_term'.
+_NAME_ONLY_ACTIONS = frozenset(("create", "modify"))
+
+# Python parameter name -> key expected by the C# ManageGameObject handler.
+# Vector parameters (position, rotation, scale, offset) are added via _normalize_vectors.
+_GO_PARAM_MAP: tuple[tuple[str, str], ...] = (
+    ("target", "target"),
+    ("search_method", "searchMethod"),
+    ("name", "name"),
+    ("tag", "tag"),
+    ("parent", "parent"),
+    ("components_to_add", "componentsToAdd"),
+    ("primitive_type", "primitiveType"),
+    ("save_as_prefab", "saveAsPrefab"),
+    ("prefab_path", "prefabPath"),
+    ("prefab_folder", "prefabFolder"),
+    ("set_active", "setActive"),
+    ("layer", "layer"),
+    ("components_to_remove", "componentsToRemove"),
+    ("component_properties", "componentProperties"),
+    ("search_term", "searchTerm"),
+    ("find_all", "findAll"),
+    ("search_in_children", "searchInChildren"),
+    ("search_inactive", "searchInactive"),
+    ("component_name", "componentName"),
+    ("includeNonPublicSerialized", "includeNonPublicSerialized"),
+    ("page_size", "pageSize"),
+    ("cursor", "cursor"),
+    ("max_components", "maxComponents"),
+    ("include_properties", "includeProperties"),
+    # Parameters for 'duplicate'
+    ("new_name", "new_name"),
+    # Parameters for 'move_relative'
+    ("reference_object", "reference_object"),
+    ("direction", "direction"),
+    ("distance", "distance"),
+    ("world_space", "world_space"),
+)
 
 
 def _normalize_vector(value: Any, default: Any = None) -> list[float] | None:
@@ -22,37 +66,46 @@ def _normalize_vector(value: Any, default: Any = None) -> list[float] | None:
     if value is None:
         return default
 
-    # If already a list/tuple with 3 elements, convert to floats
-    if isinstance(value, (list, tuple)) and len(value) == 3:
+    # Fast path: already a list/tuple with 3 elements (what FastMCP validates for)
+    if isinstance(value, (list, tuple)):
+        if len(value) != 3:
+            return default
+        if type(value) is list and type(value[0]) is float and type(value[1]) is float and type(value[2]) is float:
+            # Well-behaved client: reuse the validated list as-is
+            return value if isfinite(value[0]) and isfinite(value[1]) and isfinite(value[2]) else default
         try:
-            vec = [float(value[0]), float(value[1]), float(value[2])]
-            return vec if all(math.isfinite(n) for n in vec) else default
+            x, y, z = float(value[0]), float(value[1]), float(value[2])
         except (ValueError, TypeError):
             return default
+        return [x, y, z] if isfinite(x) and isfinite(y) and isfinite(z) else default
 
-    # Try parsing as JSON string
-    if isinstance(value, str):
-        parsed = parse_json_payload(value)
-        if isinstance(parsed, list) and len(parsed) == 3:
-            try:
-                vec = [float(parsed[0]), float(parsed[1]), float(parsed[2])]
-                return vec if all(math.isfinite(n) for n in vec) else default
-            except (ValueError, TypeError):
-                pass
-
-        # Handle legacy comma-separated strings "1,2,3" or "[1,2,3]"
-        s = value.strip()
-        if s.startswith("[") and s.endswith("]"):
-            s = s[1:-1]
-        parts = [p.strip() for p in (s.split(",") if "," in s else s.split())]
-        if len(parts) == 3:
-            try:
-                vec = [float(parts[0]), float(parts[1]), float(parts[2])]
-                return vec if all(math.isfinite(n) for n in vec) else default
-            except (ValueError, TypeError):
-                pass
-
-    return default
+    if not isinstance(value, str):
+        return default
+
+    # Try parsing as JSON string, then reuse the list path
+    parsed = parse_json_payload(value)
+    if isinstance(parsed, list):
+        vec = _normalize_vector(parsed)
+        if vec is not None:
+            return vec
+
+    # Handle legacy comma-separated strings "1,2,3" or "[1,2,3]"
+    s = value.strip()
+    if s.startswith("[") and s.endswith("]"):
+        s = s[1:-1]
+    parts = s.split(",") if "," in s else s.split()
+    vec = _normalize_vector(parts)
+    return vec if vec is not None else default
+
+
+def _normalize_vectors(*pairs: tuple[str, Any]) -> dict[str, list[float]]:
+    """Normalize several (key, value) vector parameters, keeping only those that parsed."""
+    out: dict[str, list[float]] = {}
+    for key, value in pairs:
+        vec = _normalize_vector(value)
+        if vec is not None:
+            out[key] = vec
+    return out
 
 
 def _normalize_component_properties(value: Any) -> tuple[dict[str, dict[str, Any]] | None, str | None]:
@@ -183,11 +236,20 @@ async def manage_gameobject(
             "message": "Missing required parameter 'action'. Valid actions: create, modify, delete, duplicate, move_relative. For finding GameObjects use find_gameobjects tool. For component operations use manage_components tool."
         }
 
+    # Validate parameter usage to prevent silent failures
+    if action in _NAME_ONLY_ACTIONS and search_term is not None:
+        return {
+            "success": False,
+            "message": f"For '{action}' action, use 'name' parameter, not 'search_term'."
+        }
+
     # --- Normalize vector parameters using robust helper ---
-    position = _normalize_vector(position)
-    rotation = _normalize_vector(rotation)
-    scale = _normalize_vector(scale)
-    offset = _normalize_vector(offset)
+    vectors = _normalize_vectors(
+        ("position", position),
+        ("rotation", rotation),
+        ("scale", scale),
+        ("offset", offset),
+    )
 
     # --- Normalize boolean parameters ---
     save_as_prefab = coerce_bool(save_as_prefab)
@@ -210,86 +272,46 @@ async def manage_gameobject(
     if comp_props_error:
         return {"success": False, "message": comp_props_error}
 
-    try:
-        # Validate parameter usage to prevent silent failures
-        if action in ["create", "modify"]:
-            if search_term is not None:
-                return {
-                    "success": False,
-                    "message": f"For '{action}' action, use 'name' parameter, not 'search_term'."
-                }
-
-        # Prepare parameters, removing None values
-        params = {
-            "action": action,
-            "target": target,
-            "searchMethod": search_method,
-            "name": name,
-            "tag": tag,
-            "parent": parent,
-            "position": position,
-            "rotation": rotation,
-            "scale": scale,
-            "componentsToAdd": components_to_add,
-            "primitiveType": primitive_type,
-            "saveAsPrefab": save_as_prefab,
-            "prefabPath": prefab_path,
-            "prefabFolder": prefab_folder,
-            "setActive": set_active,
-            "layer": layer,
-            "componentsToRemove": components_to_remove,
-            "componentProperties": component_properties,
-            "searchTerm": search_term,
-            "findAll": find_all,
-            "searchInChildren": search_in_children,
-            "searchInactive": search_inactive,
-            "componentName": component_name,
-            "includeNonPublicSerialized": includeNonPublicSerialized,
-            "pageSize": page_size,
-            "cursor": cursor,
-            "maxComponents": max_components,
-            "includeProperties": include_properties,
-            # Parameters for 'duplicate'
-            "new_name": new_name,
-            "offset": offset,
-            # Parameters for 'move_relative'
-            "reference_object": reference_object,
-            "direction": direction,
-            "distance": distance,
-            "world_space": world_space,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        # --- Handle Prefab Path Logic ---
-        # Check if 'saveAsPrefab' is explicitly True in params
-        if action == "create" and params.get("saveAsPrefab"):
-            if "prefabPath" not in params:
-                if "name" not in params or not params["name"]:
-                    return {"success": False, "message": "Cannot create default prefab path: 'name' parameter is missing."}
-                # Use the provided prefab_folder (which has a default) and the name to construct the path
-                constructed_path = f"{prefab_folder}/{params['name']}.prefab"
-                # Ensure clean path separators (Unity prefers '/')
-                params["prefabPath"] = constructed_path.replace("\\", "/")
-            elif not params["prefabPath"].lower().endswith(".prefab"):
-                return {"success": False, "message": f"Invalid prefab_path: '{params['prefabPath']}' must end with .prefab"}
-        # Ensure prefabFolder itself isn't sent if prefabPath was constructed or provided
-        # The C# side only needs the final prefabPath
-        params.pop("prefabFolder", None)
-        # --------------------------------
-
-        # Use centralized retry helper with instance routing
-        response = await send_with_unity_instance(
-            async_send_command_with_retry,
-            unity_instance,
-            "manage_gameobject",
-            params,
-        )
-
-        # Check if the response indicates success
-        # If the response is not successful, raise an exception with the error message
-        if isinstance(response, dict) and response.get("success"):
-            return {"success": True, "message": response.get("message", "GameObject operation successful."), "data": response.get("data")}
-        return response if isinstance(response, dict) else {"success": False, "message": str(response)}
-
-    except Exception as e:
-        return {"success": False, "message": f"Python error managing GameObject: {e!s}"}
+    # Prepare parameters, removing None values
+    local_args = locals()
+    params: dict[str, Any] = {"action": action}
+    for py_name, cs_name in _GO_PARAM_MAP:
+        value = local_args[py_name]
+        if value is not None:
+            params[cs_name] = value
+    params.update(vectors)
+
+    # --- Handle Prefab Path Logic ---
+    # Check if 'saveAsPrefab' is explicitly True in params
+    if action == "create" and params.get("saveAsPrefab"):
+        if "prefabPath" not in params:
+            if "name" not in params or not params["name"]:
+                return {"success": False, "message": "Cannot create default prefab path: 'name' parameter is missing."}
+            # Use the provided prefab_folder (which has a default) and the name to construct the path
+            constructed_path = f"{prefab_folder}/{params['name']}.prefab"
+            # Ensure clean path separators (Unity prefers '/')
+            params["prefabPath"] = constructed_path.replace("\\", "/")
+        elif not params["prefabPath"].lower().endswith(".prefab"):
+            return {"success": False, "message": f"Invalid prefab_path: '{params['prefabPath']}' must end with .prefab"}
+    # Ensure prefabFolder itself isn't sent if prefabPath was constructed or provided
+    # The C# side only needs the final prefabPath
+    params.pop("prefabFolder", None)
+    # --------------------------------
+
+    # Use centralized retry helper with instance routing (coalesced with concurrent calls when enabled)
+    response = await _batcher.send(
+        async_send_command_with_retry,
+        unity_instance,
+        params,
+    )
+
+    # Check if the response indicates success
+    # If the response is not successful, raise an exception with the error message
+    if response.get("success"):
+        if response.keys() <= _OK_ENVELOPE_KEYS:
+            # Already a plain success envelope: fill it in place instead of allocating a copy.
+            response.setdefault("message", "GameObject operation successful.")
+            response.setdefault("data", None)
+            return response
+        return {"success": True, "message": response.get("message", "GameObject operation successful."), "data": response.get("data")}
+    return response
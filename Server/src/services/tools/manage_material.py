@@ -1,7 +1,6 @@
 """
 Defines the manage_material tool for interacting with Unity materials.
 """
-import json
 from typing import Annotated, Any, Literal
 
 from fastmcp import Context
@@ -14,6 +13,18 @@ from transport.unity_transport import send_with_unity_instance
 from transport.legacy.unity_connection import async_send_command_with_retry
 
 
+# Canonical action names; the Literal annotation means clients normally send these exactly.
+_MAT_ACTIONS = {a: a for a in (
+    "ping",
+    "create",
+    "set_material_shader_property",
+    "set_material_color",
+    "assign_material_to_renderer",
+    "set_renderer_color",
+    "get_material_info",
+)}
+
+
 def _normalize_color(value: Any) -> tuple[list[float] | None, str | None]:
     """
     Normalize color parameter to [r, g, b] or [r, g, b, a] format.
@@ -24,12 +35,15 @@ def _normalize_color(value: Any) -> tuple[list[float] | None, str | None]:
 
     # Already a list - validate
     if isinstance(value, (list, tuple)):
-        if len(value) in (3, 4):
+        n = len(value)
+        if n == 3 or n == 4:
             try:
-                return [float(c) for c in value], None
+                if n == 3:
+                    return [float(value[0]), float(value[1]), float(value[2])], None
+                return [float(value[0]), float(value[1]), float(value[2]), float(value[3])], None
             except (ValueError, TypeError):
                 return None, f"color values must be numbers, got {value}"
-        return None, f"color must have 3 or 4 components, got {len(value)}"
+        return None, f"color must have 3 or 4 components, got {n}"
 
     # Try parsing as string
     if isinstance(value, str):
@@ -37,11 +51,8 @@ def _normalize_color(value: Any) -> tuple[list[float] | None, str | None]:
             return None, f"color received invalid value: '{value}'. Expected [r, g, b] or [r, g, b, a]"
 
         parsed = parse_json_payload(value)
-        if isinstance(parsed, (list, tuple)) and len(parsed) in (3, 4):
-            try:
-                return [float(c) for c in parsed], None
-            except (ValueError, TypeError):
-                return None, f"color values must be numbers, got {parsed}"
+        if isinstance(parsed, list) and len(parsed) in (3, 4):
+            return _normalize_color(parsed)
         return None, f"Failed to parse color string: {value}"
 
     return None, f"color must be a list or JSON string, got {type(value).__name__}"
@@ -108,16 +119,17 @@ async def manage_material(
         return {"success": False, "message": props_error}
 
     # --- Normalize value (parse JSON if string) ---
-    value = parse_json_payload(value)
-    if isinstance(value, str) and value in ("[object Object]", "undefined"):
-        return {"success": False, "message": f"value received invalid input: '{value}'"}
+    if isinstance(value, str):
+        if value in ("[object Object]", "undefined"):
+            return {"success": False, "message": f"value received invalid input: '{value}'"}
+        value = parse_json_payload(value)
 
     # --- Normalize slot to int ---
     slot = coerce_int(slot)
 
     # Prepare parameters for the C# handler
     params_dict = {
-        "action": action.lower(),
+        "action": _MAT_ACTIONS.get(action) or action.lower(),
         "materialPath": material_path,
         "shader": shader,
         "properties": properties,
@@ -37,32 +37,29 @@ async def manage_prefabs(
     # Removed session_state import
     unity_instance = get_unity_instance_from_context(ctx)
 
-    try:
-        params: dict[str, Any] = {"action": action}
+    params: dict[str, Any] = {"action": action}
 
-        if prefab_path:
-            params["prefabPath"] = prefab_path
-        if mode:
-            params["mode"] = mode
-        save_before_close_val = coerce_bool(save_before_close)
-        if save_before_close_val is not None:
-            params["saveBeforeClose"] = save_before_close_val
-        if target:
-            params["target"] = target
-        allow_overwrite_val = coerce_bool(allow_overwrite)
-        if allow_overwrite_val is not None:
-            params["allowOverwrite"] = allow_overwrite_val
-        search_inactive_val = coerce_bool(search_inactive)
-        if search_inactive_val is not None:
-            params["searchInactive"] = search_inactive_val
-        response = await send_with_unity_instance(async_send_command_with_retry, unity_instance, "manage_prefabs", params)
+    if prefab_path:
+        params["prefabPath"] = prefab_path
+    if mode:
+        params["mode"] = mode
+    save_before_close_val = coerce_bool(save_before_close)
+    if save_before_close_val is not None:
+        params["saveBeforeClose"] = save_before_close_val
+    if target:
+        params["target"] = target
+    allow_overwrite_val = coerce_bool(allow_overwrite)
+    if allow_overwrite_val is not None:
+        params["allowOverwrite"] = allow_overwrite_val
+    search_inactive_val = coerce_bool(search_inactive)
+    if search_inactive_val is not None:
+        params["searchInactive"] = search_inactive_val
+    response = await send_with_unity_instance(async_send_command_with_retry, unity_instance, "manage_prefabs", params)
 
-        if isinstance(response, dict) and response.get("success"):
-            return {
-                "success": True,
-                "message": response.get("message", "Prefab operation successful."),
-                "data": response.get("data"),
-            }
-        return response if isinstance(response, dict) else {"success": False, "message": str(response)}
-    except Exception as exc:
-        return {"success": False, "message": f"Python error managing prefabs: {exc}"}
+    if response.get("success"):
+        return {
+            "success": True,
+            "message": response.get("message", "Prefab operation successful."),
+            "data": response.get("data"),
+        }
+    return response
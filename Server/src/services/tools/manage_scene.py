@@ -59,53 +59,49 @@ async def manage_scene(
     gate = await preflight(ctx, wait_for_no_compile=True, refresh_if_dirty=True)
     if gate is not None:
         return gate.model_dump()
-    try:
-        coerced_build_index = coerce_int(build_index, default=None)
-        coerced_super_size = coerce_int(screenshot_super_size, default=None)
-        coerced_page_size = coerce_int(page_size, default=None)
-        coerced_cursor = coerce_int(cursor, default=None)
-        coerced_max_nodes = coerce_int(max_nodes, default=None)
-        coerced_max_depth = coerce_int(max_depth, default=None)
-        coerced_max_children_per_node = coerce_int(
-            max_children_per_node, default=None)
-        coerced_include_transform = coerce_bool(
-            include_transform, default=None)
+    coerced_build_index = coerce_int(build_index, default=None)
+    coerced_super_size = coerce_int(screenshot_super_size, default=None)
+    coerced_page_size = coerce_int(page_size, default=None)
+    coerced_cursor = coerce_int(cursor, default=None)
+    coerced_max_nodes = coerce_int(max_nodes, default=None)
+    coerced_max_depth = coerce_int(max_depth, default=None)
+    coerced_max_children_per_node = coerce_int(
+        max_children_per_node, default=None)
+    coerced_include_transform = coerce_bool(
+        include_transform, default=None)
 
-        params: dict[str, Any] = {"action": action}
-        if name:
-            params["name"] = name
-        if path:
-            params["path"] = path
-        if coerced_build_index is not None:
-            params["buildIndex"] = coerced_build_index
-        if screenshot_file_name:
-            params["fileName"] = screenshot_file_name
-        if coerced_super_size is not None:
-            params["superSize"] = coerced_super_size
+    params: dict[str, Any] = {"action": action}
+    if name:
+        params["name"] = name
+    if path:
+        params["path"] = path
+    if coerced_build_index is not None:
+        params["buildIndex"] = coerced_build_index
+    if screenshot_file_name:
+        params["fileName"] = screenshot_file_name
+    if coerced_super_size is not None:
+        params["superSize"] = coerced_super_size
 
-        # get_hierarchy paging/safety params (optional)
-        if parent is not None:
-            params["parent"] = parent
-        if coerced_page_size is not None:
-            params["pageSize"] = coerced_page_size
-        if coerced_cursor is not None:
-            params["cursor"] = coerced_cursor
-        if coerced_max_nodes is not None:
-            params["maxNodes"] = coerced_max_nodes
-        if coerced_max_depth is not None:
-            params["maxDepth"] = coerced_max_depth
-        if coerced_max_children_per_node is not None:
-            params["maxChildrenPerNode"] = coerced_max_children_per_node
-        if coerced_include_transform is not None:
-            params["includeTransform"] = coerced_include_transform
+    # get_hierarchy paging/safety params (optional)
+    if parent is not None:
+        params["parent"] = parent
+    if coerced_page_size is not None:
+        params["pageSize"] = coerced_page_size
+    if coerced_cursor is not None:
+        params["cursor"] = coerced_cursor
+    if coerced_max_nodes is not None:
+        params["maxNodes"] = coerced_max_nodes
+    if coerced_max_depth is not None:
+        params["maxDepth"] = coerced_max_depth
+    if coerced_max_children_per_node is not None:
+        params["maxChildrenPerNode"] = coerced_max_children_per_node
+    if coerced_include_transform is not None:
+        params["includeTransform"] = coerced_include_transform
 
-        # Use centralized retry helper with instance routing
-        response = await send_with_unity_instance(async_send_command_with_retry, unity_instance, "manage_scene", params)
+    # Use centralized retry helper with instance routing
+    response = await send_with_unity_instance(async_send_command_with_retry, unity_instance, "manage_scene", params)
 
-        # Preserve structured failure data; unwrap success into a friendlier shape
-        if isinstance(response, dict) and response.get("success"):
-            return {"success": True, "message": response.get("message", "Scene operation successful."), "data": response.get("data")}
-        return response if isinstance(response, dict) else {"success": False, "message": str(response)}
-
-    except Exception as e:
-        return {"success": False, "message": f"Python error managing scene: {str(e)}"}
+    # Preserve structured failure data; unwrap success into a friendlier shape
+    if response.get("success"):
+        return {"success": True, "message": response.get("message", "Scene operation successful."), "data": response.get("data")}
+    return response
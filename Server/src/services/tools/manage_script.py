@@ -1,5 +1,9 @@
-import base64
+import asyncio
 import os
+import re
+from bisect import bisect_left
+from functools import lru_cache
+from operator import itemgetter
 from typing import Annotated, Any, Literal
 from urllib.parse import urlparse, unquote
 
@@ -8,10 +12,32 @@ from mcp.types import ToolAnnotations
 
 from services.registry import mcp_for_unity_tool
 from services.tools import get_unity_instance_from_context
+from services.tools.preflight import invalidate_preflight_cache
+from services.tools.utils import decode_base64_text, encode_base64_text
 from transport.unity_transport import send_with_unity_instance
 import transport.legacy.unity_connection
+from utils import json_codec
 
 
+# First 'Assets' path segment, matched case-insensitively.
+_ASSETS_SEGMENT_RE = re.compile(r"(?:^|/)(assets(?:/|$))", re.IGNORECASE)
+
+# Substrings that mean a path still needs decoding or normalizing in _split_uri.
+_UNCLEAN_PATH_TOKENS = ("%", "\\", "./", "//", "..")
+
+# Explicit 1-based coordinate fields of a text edit.
+_COORD_KEYS = ("startLine", "startCol", "endLine", "endCol")
+
+# Directory of the unity-mcp-status-*.json files Unity writes per project; the newest
+# one reflects the current editor state.
+_STATUS_DIR = os.path.expanduser("~/.unity-mcp")
+
+# Pending sentinel flips, referenced so they are not garbage-collected mid-flight.
+_sentinel_tasks: set[asyncio.Task] = set()
+
+
+# Pure function of the URI; read -> get_sha -> apply_text_edits commonly repeat the same one.
+@lru_cache(maxsize=1024)
 def _split_uri(uri: str) -> tuple[str, str]:
     """Split an incoming URI or path into (name, directory) suitable for Unity.
 
@@ -23,6 +49,11 @@ def _split_uri(uri: str) -> tuple[str, str]:
     - plain paths → decode/normalize separators; if they contain an 'Assets' segment,
         return relative to 'Assets'.
     """
+    # Fast path: an already-clean Assets-relative path needs no decoding or normalization.
+    if uri.startswith("Assets/") and not uri.endswith(("/", "/.")) \
+            and not any(tok in uri for tok in _UNCLEAN_PATH_TOKENS):
+        return os.path.splitext(os.path.basename(uri))[0], os.path.dirname(uri)
+
     raw_path: str
     if uri.startswith("mcpforunity://path/"):
         raw_path = uri[len("mcpforunity://path/"):]
@@ -34,24 +65,30 @@ def _split_uri(uri: str) -> tuple[str, str]:
         if host and host.lower() != "localhost":
             p = f"//{host}{p}"
         # Use percent-decoded path, preserving leading slashes
-        raw_path = unquote(p)
+        raw_path = unquote(p) if "%" in p else p
     else:
         raw_path = uri
 
-    # Percent-decode any residual encodings and normalize separators
-    raw_path = unquote(raw_path).replace("\\", "/")
+    # Percent-decode any residual encodings and normalize separators.
+    # Most paths carry no escapes at all, so skip the decoder call for them.
+    if "%" in raw_path:
+        raw_path = unquote(raw_path)
+    raw_path = raw_path.replace("\\", "/")
     # Strip leading slash only for Windows drive-letter forms like "/C:/..."
     if os.name == "nt" and len(raw_path) >= 3 and raw_path[0] == "/" and raw_path[2] == ":":
         raw_path = raw_path[1:]
 
-    # Normalize path (collapse ../, ./)
-    norm = os.path.normpath(raw_path).replace("\\", "/")
+    # Normalize path (collapse ../, ./). A path with no empty or dot segments and no
+    # trailing separator is already normal, so skip normpath and the separator round-trip.
+    if raw_path and "//" not in raw_path and "./" not in raw_path and not raw_path.endswith(("/", ".")):
+        norm = raw_path
+    else:
+        norm = os.path.normpath(raw_path).replace("\\", "/")
 
-    # If an 'Assets' segment exists, compute path relative to it (case-insensitive)
-    parts = [p for p in norm.split("/") if p not in ("", ".")]
-    idx = next((i for i, seg in enumerate(parts)
-                if seg.lower() == "assets"), None)
-    assets_rel = "/".join(parts[idx:]) if idx is not None else None
+    # If an 'Assets' segment exists, compute path relative to it (case-insensitive).
+    # normpath already collapsed empty and '.' segments, so slicing at the match is enough.
+    m = _ASSETS_SEGMENT_RE.search(norm)
+    assets_rel = norm[m.start(1):] if m else None
 
     effective_path = assets_rel if assets_rel else norm
     # For POSIX absolute paths outside Assets, drop the leading '/'
@@ -64,6 +101,72 @@ def _split_uri(uri: str) -> tuple[str, str]:
     return name, directory
 
 
+def _is_under_assets(directory: str) -> bool:
+    """True if the first segment of an Assets-relative directory is 'Assets' (case-insensitive)."""
+    return directory[:6].lower() == "assets" and (len(directory) == 6 or directory[6] == "/")
+
+
+def _zero_based_coord_keys(edit: dict[str, Any]) -> list[str]:
+    """Return the explicit coordinate keys whose value is below 1; non-numeric values are left for Unity to reject."""
+    keys: list[str] = []
+    for k in _COORD_KEYS:
+        try:
+            if int(edit.get(k, 1)) < 1:
+                keys.append(k)
+        except Exception:
+            pass
+    return keys
+
+
+def _newline_offsets(text: str) -> list[int]:
+    """Return the index of every '\\n' in text, in ascending order."""
+    offsets: list[int] = []
+    find = text.find
+    i = find("\n")
+    while i != -1:
+        offsets.append(i)
+        i = find("\n", i + 1)
+    return offsets
+
+
+def _latest_status() -> dict | None:
+    """Return the most recently written Unity status file, or None if unavailable."""
+    try:
+        # One directory scan; pick the newest file without sorting the whole listing.
+        with os.scandir(_STATUS_DIR) as it:
+            latest = max(
+                (entry for entry in it
+                 if entry.name.startswith("unity-mcp-status-") and entry.name.endswith(".json")),
+                key=lambda entry: entry.stat().st_mtime_ns,
+                default=None,
+            )
+        if latest is None:
+            return None
+        with open(latest.path, "rb") as f:
+            raw = f.read()
+        return json_codec.loads(raw)
+    except Exception:
+        return None
+
+
+async def _flip_sentinel_async(unity_instance: str | None) -> None:
+    """Flip the reload sentinel via its menu item, unless Unity is already reloading."""
+    try:
+        await asyncio.sleep(0.1)
+        st = _latest_status()
+        if st and st.get("reloading"):
+            return
+        await transport.legacy.unity_connection.async_send_command_with_retry(
+            "execute_menu_item",
+            {"menuPath": "MCP/Flip Reload Sentinel"},
+            max_retries=0,
+            retry_ms=0,
+            instance_id=unity_instance,
+        )
+    except Exception:
+        pass
+
+
 @mcp_for_unity_tool(
     description=(
         """Apply small text edits to a C# script identified by URI.
@@ -103,180 +206,150 @@ async def apply_text_edits(
     # Normalize common aliases/misuses for resilience:
     # - Accept LSP-style range objects: {range:{start:{line,character}, end:{...}}, newText|text}
     # - Accept index ranges as a 2-int array: {range:[startIndex,endIndex], text}
-    # If normalization is required, read current contents to map indices -> 1-based line/col.
-    def _needs_normalization(arr: list[dict[str, Any]]) -> bool:
-        for e in arr or []:
-            if ("startLine" not in e) or ("startCol" not in e) or ("endLine" not in e) or ("endCol" not in e) or ("newText" not in e and "text" in e):
-                return True
-        return False
-
+    # Explicit 1-based coordinates are still validated. The current file contents are only
+    # read from Unity on the first index range, which needs them to map indices -> line/col.
     normalized_edits: list[dict[str, Any]] = []
     warnings: list[str] = []
-    if _needs_normalization(edits):
-        # Read file to support index->line/col conversion when needed
-        read_resp = await send_with_unity_instance(
-            transport.legacy.unity_connection.async_send_command_with_retry,
-            unity_instance,
-            "manage_script",
-            {
-                "action": "read",
-                "name": name,
-                "path": directory,
-            },
-        )
-        if not (isinstance(read_resp, dict) and read_resp.get("success")):
-            return read_resp if isinstance(read_resp, dict) else {"success": False, "message": str(read_resp)}
-        data = read_resp.get("data", {})
-        contents = data.get("contents")
-        if not contents and data.get("contentsEncoded") and data.get("encodedContents"):
-            try:
-                contents = base64.b64decode(data.get("encodedContents", "").encode(
-                    "utf-8")).decode("utf-8", "replace")
-            except Exception:
-                contents = contents or ""
-
-        # Helper to map 0-based character index to 1-based line/col
-        def line_col_from_index(idx: int) -> tuple[int, int]:
-            if idx <= 0:
-                return 1, 1
-            # Count lines up to idx and position within line
-            nl_count = contents.count("\n", 0, idx)
-            line = nl_count + 1
-            last_nl = contents.rfind("\n", 0, idx)
-            col = (idx - (last_nl + 1)) + 1 if last_nl >= 0 else idx + 1
-            return line, col
-
-        for e in edits or []:
+    contents: str | None = None
+    contents_loaded = False
+    # Offsets of every newline in contents, built once on first index lookup
+    nl_offsets: list[int] | None = None
+
+    # Helper to map 0-based character index to 1-based line/col
+    def line_col_from_index(idx: int) -> tuple[int, int]:
+        nonlocal nl_offsets
+        if idx <= 0:
+            return 1, 1
+        if nl_offsets is None:
+            nl_offsets = _newline_offsets(contents)
+        # Newlines before idx give the line; the last of them anchors the column
+        nl_count = bisect_left(nl_offsets, idx)
+        last_nl = nl_offsets[nl_count - 1] if nl_count else -1
+        return nl_count + 1, idx - last_nl
+
+    # A strict-mode zero-based error reports the edits normalized before it when the list mixes
+    # forms, and just the offending edit when every edit was already explicit.
+    all_explicit = not any(
+        any(k not in e for k in _COORD_KEYS) or ("newText" not in e and "text" in e)
+        for e in edits or []
+    )
+
+    append_edit = normalized_edits.append
+    for e in edits or []:
+        # Edits already in final form are forwarded as-is; copy only before the first change
+        e2 = e
+        # Map text->newText if needed
+        if "newText" not in e and "text" in e:
             e2 = dict(e)
-            # Map text->newText if needed
-            if "newText" not in e2 and "text" in e2:
-                e2["newText"] = e2.pop("text")
-
-            if "startLine" in e2 and "startCol" in e2 and "endLine" in e2 and "endCol" in e2:
-                # Guard: explicit fields must be 1-based.
-                zero_based = False
-                for k in ("startLine", "startCol", "endLine", "endCol"):
-                    try:
-                        if int(e2.get(k, 1)) < 1:
-                            zero_based = True
-                    except Exception:
-                        pass
-                if zero_based:
-                    if strict:
-                        return {"success": False, "code": "zero_based_explicit_fields", "message": "Explicit line/col fields are 1-based; received zero-based.", "data": {"normalizedEdits": normalized_edits}}
-                    # Normalize by clamping to 1 and warn
-                    for k in ("startLine", "startCol", "endLine", "endCol"):
-                        try:
-                            if int(e2.get(k, 1)) < 1:
-                                e2[k] = 1
-                        except Exception:
-                            pass
+            e2["newText"] = e2.pop("text")
+
+        if "startLine" in e2 and "startCol" in e2 and "endLine" in e2 and "endCol" in e2:
+            # Guard: explicit fields must be 1-based.
+            zero_based_keys = _zero_based_coord_keys(e2)
+            if zero_based_keys:
+                if strict:
+                    return {"success": False, "code": "zero_based_explicit_fields", "message": "Explicit line/col fields are 1-based; received zero-based.", "data": {"normalizedEdits": [e2] if all_explicit else normalized_edits}}
+                # Normalize by clamping to 1 and warn
+                if e2 is e:
+                    e2 = dict(e)
+                for k in zero_based_keys:
+                    e2[k] = 1
+                if "zero_based_explicit_fields_normalized" not in warnings:
                     warnings.append(
                         "zero_based_explicit_fields_normalized")
-                normalized_edits.append(e2)
-                continue
+            append_edit(e2)
+            continue
 
-            rng = e2.get("range")
-            if isinstance(rng, dict):
-                # LSP style: 0-based
-                s = rng.get("start", {})
-                t = rng.get("end", {})
-                e2["startLine"] = int(s.get("line", 0)) + 1
-                e2["startCol"] = int(s.get("character", 0)) + 1
-                e2["endLine"] = int(t.get("line", 0)) + 1
-                e2["endCol"] = int(t.get("character", 0)) + 1
-                e2.pop("range", None)
-                normalized_edits.append(e2)
-                continue
-            if isinstance(rng, (list, tuple)) and len(rng) == 2:
-                try:
-                    a = int(rng[0])
-                    b = int(rng[1])
-                    if b < a:
-                        a, b = b, a
-                    sl, sc = line_col_from_index(a)
-                    el, ec = line_col_from_index(b)
-                    e2["startLine"] = sl
-                    e2["startCol"] = sc
-                    e2["endLine"] = el
-                    e2["endCol"] = ec
-                    e2.pop("range", None)
-                    normalized_edits.append(e2)
-                    continue
-                except Exception:
-                    pass
-            # Could not normalize this edit
-            return {
-                "success": False,
-                "code": "missing_field",
-                "message": "apply_text_edits requires startLine/startCol/endLine/endCol/newText or a normalizable 'range'",
-                "data": {"expected": ["startLine", "startCol", "endLine", "endCol", "newText"], "got": e}
-            }
-    else:
-        # Even when edits appear already in explicit form, validate 1-based coordinates.
-        normalized_edits = []
-        for e in edits or []:
+        rng = e2.get("range")
+        if isinstance(rng, (dict, list, tuple)) and e2 is e:
             e2 = dict(e)
-            has_all = all(k in e2 for k in (
-                "startLine", "startCol", "endLine", "endCol"))
-            if has_all:
-                zero_based = False
-                for k in ("startLine", "startCol", "endLine", "endCol"):
+        if isinstance(rng, dict):
+            # LSP style: 0-based
+            s = rng.get("start", {})
+            t = rng.get("end", {})
+            e2["startLine"] = int(s.get("line", 0)) + 1
+            e2["startCol"] = int(s.get("character", 0)) + 1
+            e2["endLine"] = int(t.get("line", 0)) + 1
+            e2["endCol"] = int(t.get("character", 0)) + 1
+            e2.pop("range", None)
+            append_edit(e2)
+            continue
+        if isinstance(rng, (list, tuple)) and len(rng) == 2:
+            if not contents_loaded:
+                # Read file to support index->line/col conversion
+                read_resp = await send_with_unity_instance(
+                    transport.legacy.unity_connection.async_send_command_with_retry,
+                    unity_instance,
+                    "manage_script",
+                    {
+                        "action": "read",
+                        "name": name,
+                        "path": directory,
+                    },
+                )
+                if not read_resp.get("success"):
+                    return read_resp
+                data = read_resp.get("data", {})
+                contents = data.get("contents")
+                if not contents and data.get("contentsEncoded") and data.get("encodedContents"):
                     try:
-                        if int(e2.get(k, 1)) < 1:
-                            zero_based = True
+                        contents = decode_base64_text(
+                            data.get("encodedContents", ""), errors="replace")
                     except Exception:
-                        pass
-                if zero_based:
-                    if strict:
-                        return {"success": False, "code": "zero_based_explicit_fields", "message": "Explicit line/col fields are 1-based; received zero-based.", "data": {"normalizedEdits": [e2]}}
-                    for k in ("startLine", "startCol", "endLine", "endCol"):
-                        try:
-                            if int(e2.get(k, 1)) < 1:
-                                e2[k] = 1
-                        except Exception:
-                            pass
-                    if "zero_based_explicit_fields_normalized" not in warnings:
-                        warnings.append(
-                            "zero_based_explicit_fields_normalized")
-            normalized_edits.append(e2)
-
-    # Preflight: detect overlapping ranges among normalized line/col spans
-    def _pos_tuple(e: dict[str, Any], key_start: bool) -> tuple[int, int]:
-        return (
-            int(e.get("startLine", 1)) if key_start else int(
-                e.get("endLine", 1)),
-            int(e.get("startCol", 1)) if key_start else int(
-                e.get("endCol", 1)),
-        )
-
-    def _le(a: tuple[int, int], b: tuple[int, int]) -> bool:
-        return a[0] < b[0] or (a[0] == b[0] and a[1] <= b[1])
+                        contents = contents or ""
+                contents_loaded = True
+            try:
+                a = int(rng[0])
+                b = int(rng[1])
+                if b < a:
+                    a, b = b, a
+                sl, sc = line_col_from_index(a)
+                el, ec = line_col_from_index(b)
+                e2["startLine"] = sl
+                e2["startCol"] = sc
+                e2["endLine"] = el
+                e2["endCol"] = ec
+                e2.pop("range", None)
+                append_edit(e2)
+                continue
+            except Exception:
+                pass
+        # Could not normalize this edit
+        return {
+            "success": False,
+            "code": "missing_field",
+            "message": "apply_text_edits requires startLine/startCol/endLine/endCol/newText or a normalizable 'range'",
+            "data": {"expected": ["startLine", "startCol", "endLine", "endCol", "newText"], "got": e}
+        }
 
+    # Preflight: detect overlapping ranges among normalized line/col spans.
+    # Positions are packed as (line << 32) + col so ordering is a single int compare;
+    # the (line, col) pairs are kept alongside only for the conflict report.
     # Consider only true replace ranges (non-zero length). Pure insertions (zero-width) don't overlap.
-    spans = []
+    spans: list[tuple[int, int, tuple[int, int], tuple[int, int]]] = []
     for e in normalized_edits or []:
         try:
-            s = _pos_tuple(e, True)
-            t = _pos_tuple(e, False)
+            s = (int(e.get("startLine", 1)), int(e.get("startCol", 1)))
+            t = (int(e.get("endLine", 1)), int(e.get("endCol", 1)))
             if s != t:
-                spans.append((s, t))
+                spans.append(((s[0] << 32) + s[1], (t[0] << 32) + t[1], s, t))
         except Exception:
             # If coordinates missing or invalid, let the server validate later
             pass
 
-    if spans:
-        spans_sorted = sorted(spans, key=lambda p: (p[0][0], p[0][1]))
-        for i in range(1, len(spans_sorted)):
-            prev_end = spans_sorted[i-1][1]
-            curr_start = spans_sorted[i][0]
-            # Overlap if prev_end > curr_start (strict), i.e., not prev_end <= curr_start
-            if not _le(prev_end, curr_start):
+    # A single span cannot overlap anything; the common one-edit call skips the sort entirely.
+    if len(spans) > 1:
+        spans.sort(key=itemgetter(0))
+        for i in range(1, len(spans)):
+            prev = spans[i - 1]
+            curr = spans[i]
+            # Overlap if the previous span ends strictly after the current one starts
+            if prev[1] > curr[0]:
                 conflicts = [{
-                    "startA": {"line": spans_sorted[i-1][0][0], "col": spans_sorted[i-1][0][1]},
-                    "endA":   {"line": spans_sorted[i-1][1][0], "col": spans_sorted[i-1][1][1]},
-                    "startB": {"line": spans_sorted[i][0][0],  "col": spans_sorted[i][0][1]},
-                    "endB":   {"line": spans_sorted[i][1][0],  "col": spans_sorted[i][1][1]},
+                    "startA": {"line": prev[2][0], "col": prev[2][1]},
+                    "endA":   {"line": prev[3][0], "col": prev[3][1]},
+                    "startB": {"line": curr[2][0], "col": curr[2][1]},
+                    "endB":   {"line": curr[3][0], "col": curr[3][1]},
                 }]
                 return {"success": False, "code": "overlap", "data": {"status": "overlap", "conflicts": conflicts}}
 
@@ -285,31 +358,21 @@ async def apply_text_edits(
     # preserves existing call-count expectations in clients/tests.
 
     # Default options: for multi-span batches, prefer atomic to avoid mid-apply imbalance
-    opts: dict[str, Any] = dict(options or {})
-    try:
-        if len(normalized_edits) > 1 and "applyMode" not in opts:
-            opts["applyMode"] = "atomic"
-    except Exception:
-        pass
-    # Support optional debug preview for span-by-span simulation without write
+    # The caller's options are only read here, so copy them only when adding applyMode.
+    opts: dict[str, Any] = options or {}
+    if len(normalized_edits) > 1 and "applyMode" not in opts:
+        opts = {**opts, "applyMode": "atomic"}
+    # Support optional debug preview: return the normalized spans without writing.
+    # File contents are not guaranteed to be available here, so no local diff is produced.
     if opts.get("debug_preview"):
-        try:
-            import difflib
-            # Apply locally to preview final result
-            lines = []
-            # Build an indexable original from a read if we normalized from read; otherwise skip
-            prev = ""
-            # We cannot guarantee file contents here without a read; return normalized spans only
-            return {
-                "success": True,
-                "message": "Preview only (no write)",
-                "data": {
-                    "normalizedEdits": normalized_edits,
-                    "preview": True
-                }
+        return {
+            "success": True,
+            "message": "Preview only (no write)",
+            "data": {
+                "normalizedEdits": normalized_edits,
+                "preview": True
             }
-        except Exception as e:
-            return {"success": False, "code": "preview_failed", "message": f"debug_preview failed: {e}", "data": {"normalizedEdits": normalized_edits}}
+        }
 
     params = {
         "action": "apply_text_edits",
@@ -326,52 +389,19 @@ async def apply_text_edits(
         "manage_script",
         params,
     )
-    if isinstance(resp, dict):
-        data = resp.setdefault("data", {})
-        data.setdefault("normalizedEdits", normalized_edits)
-        if warnings:
-            data.setdefault("warnings", warnings)
-        if resp.get("success") and (options or {}).get("force_sentinel_reload"):
-            # Optional: flip sentinel via menu if explicitly requested
-            try:
-                import threading
-                import time
-                import json
-                import glob
-                import os
-
-                def _latest_status() -> dict | None:
-                    try:
-                        files = sorted(glob.glob(os.path.expanduser(
-                            "~/.unity-mcp/unity-mcp-status-*.json")), key=os.path.getmtime, reverse=True)
-                        if not files:
-                            return None
-                        with open(files[0], "r") as f:
-                            return json.loads(f.read())
-                    except Exception:
-                        return None
-
-                async def _flip_async():
-                    try:
-                        time.sleep(0.1)
-                        st = _latest_status()
-                        if st and st.get("reloading"):
-                            return
-                        await transport.legacy.unity_connection.async_send_command_with_retry(
-                            "execute_menu_item",
-                            {"menuPath": "MCP/Flip Reload Sentinel"},
-                            max_retries=0,
-                            retry_ms=0,
-                            instance_id=unity_instance,
-                        )
-                    except Exception:
-                        pass
-                threading.Thread(target=_flip_async, daemon=True).start()
-            except Exception:
-                pass
-            return resp
-        return resp
-    return {"success": False, "message": str(resp)}
+    if resp.get("success"):
+        # The write can start a compile; drop preflight passes cached before it.
+        invalidate_preflight_cache()
+    data = resp.setdefault("data", {})
+    data.setdefault("normalizedEdits", normalized_edits)
+    if warnings:
+        data.setdefault("warnings", warnings)
+    if resp.get("success") and (options or {}).get("force_sentinel_reload"):
+        # Optional: flip sentinel via menu if explicitly requested
+        task = asyncio.create_task(_flip_sentinel_async(unity_instance))
+        _sentinel_tasks.add(task)
+        task.add_done_callback(_sentinel_tasks.discard)
+    return resp
 
 
 @mcp_for_unity_tool(
@@ -396,7 +426,7 @@ async def create_script(
     # Local validation to avoid round-trips on obviously bad input
     norm_path = os.path.normpath(
         (path or "").replace("\\", "/")).replace("\\", "/")
-    if not directory or directory.split("/")[0].lower() != "assets":
+    if not _is_under_assets(directory):
         return {"success": False, "code": "path_outside_assets", "message": f"path must be under 'Assets/'; got '{path}'."}
     if ".." in norm_path.split("/") or norm_path.startswith("/"):
         return {"success": False, "code": "bad_path", "message": "path must not contain traversal or be absolute."}
@@ -412,8 +442,7 @@ async def create_script(
         "scriptType": script_type,
     }
     if contents:
-        params["encodedContents"] = base64.b64encode(
-            contents.encode("utf-8")).decode("utf-8")
+        params["encodedContents"] = encode_base64_text(contents)
         params["contentsEncoded"] = True
     params = {k: v for k, v in params.items() if v is not None}
     resp = await send_with_unity_instance(
@@ -422,7 +451,9 @@ async def create_script(
         "manage_script",
         params,
     )
-    return resp if isinstance(resp, dict) else {"success": False, "message": str(resp)}
+    if resp.get("success"):
+        invalidate_preflight_cache()
+    return resp
 
 
 @mcp_for_unity_tool(
@@ -441,7 +472,7 @@ async def delete_script(
     await ctx.info(
         f"Processing delete_script: {uri} (unity_instance={unity_instance or 'default'})")
     name, directory = _split_uri(uri)
-    if not directory or directory.split("/")[0].lower() != "assets":
+    if not _is_under_assets(directory):
         return {"success": False, "code": "path_outside_assets", "message": "URI must resolve under 'Assets/'."}
     params = {"action": "delete", "name": name, "path": directory}
     resp = await send_with_unity_instance(
@@ -450,7 +481,9 @@ async def delete_script(
         "manage_script",
         params,
     )
-    return resp if isinstance(resp, dict) else {"success": False, "message": str(resp)}
+    if resp.get("success"):
+        invalidate_preflight_cache()
+    return resp
 
 
 @mcp_for_unity_tool(
@@ -472,7 +505,7 @@ async def validate_script(
     await ctx.info(
         f"Processing validate_script: {uri} (unity_instance={unity_instance or 'default'})")
     name, directory = _split_uri(uri)
-    if not directory or directory.split("/")[0].lower() != "assets":
+    if not _is_under_assets(directory):
         return {"success": False, "code": "path_outside_assets", "message": "URI must resolve under 'Assets/'."}
     if level not in ("basic", "standard"):
         return {"success": False, "code": "bad_level", "message": "level must be 'basic' or 'standard'."}
@@ -488,7 +521,7 @@ async def validate_script(
         "manage_script",
         params,
     )
-    if isinstance(resp, dict) and resp.get("success"):
+    if resp.get("success"):
         diags = resp.get("data", {}).get("diagnostics", []) or []
         warnings = sum(1 for d in diags if str(
             d.get("severity", "")).lower() == "warning")
@@ -497,7 +530,7 @@ async def validate_script(
         if include_diagnostics:
             return {"success": True, "data": {"diagnostics": diags, "summary": {"warnings": warnings, "errors": errors}}}
         return {"success": True, "data": {"warnings": warnings, "errors": errors}}
-    return resp if isinstance(resp, dict) else {"success": False, "message": str(resp)}
+    return resp
 
 
 @mcp_for_unity_tool(
@@ -534,8 +567,7 @@ async def manage_script(
         # Base64 encode the contents if they exist to avoid JSON escaping issues
         if contents:
             if action == 'create':
-                params["encodedContents"] = base64.b64encode(
-                    contents.encode('utf-8')).decode('utf-8')
+                params["encodedContents"] = encode_base64_text(contents)
                 params["contentsEncoded"] = True
             else:
                 params["contents"] = contents
@@ -549,23 +581,22 @@ async def manage_script(
             params,
         )
 
-        if isinstance(response, dict):
-            if response.get("success"):
-                if response.get("data", {}).get("contentsEncoded"):
-                    decoded_contents = base64.b64decode(
-                        response["data"]["encodedContents"]).decode('utf-8')
-                    response["data"]["contents"] = decoded_contents
-                    del response["data"]["encodedContents"]
-                    del response["data"]["contentsEncoded"]
-
-                return {
-                    "success": True,
-                    "message": response.get("message", "Operation successful."),
-                    "data": response.get("data"),
-                }
-            return response
+        if response.get("success"):
+            if action != "read":
+                invalidate_preflight_cache()
+            if response.get("data", {}).get("contentsEncoded"):
+                decoded_contents = decode_base64_text(
+                    response["data"]["encodedContents"])
+                response["data"]["contents"] = decoded_contents
+                del response["data"]["encodedContents"]
+                del response["data"]["contentsEncoded"]
 
-        return {"success": False, "message": str(response)}
+            return {
+                "success": True,
+                "message": response.get("message", "Operation successful."),
+                "data": response.get("data"),
+            }
+        return response
 
     except Exception as e:
         return {
@@ -635,11 +666,11 @@ async def get_sha(
             "manage_script",
             params,
         )
-        if isinstance(resp, dict) and resp.get("success"):
+        if resp.get("success"):
             data = resp.get("data", {})
             minimal = {"sha256": data.get(
                 "sha256"), "lengthBytes": data.get("lengthBytes")}
             return {"success": True, "data": minimal}
-        return resp if isinstance(resp, dict) else {"success": False, "message": str(resp)}
+        return resp
     except Exception as e:
         return {"success": False, "message": f"get_sha error: {e}"}
@@ -17,11 +17,21 @@ from mcp.types import ToolAnnotations
 
 from services.registry import mcp_for_unity_tool
 from services.tools import get_unity_instance_from_context
+from services.tools.command_batcher import CommandBatcher
 from services.tools.utils import coerce_bool, parse_json_payload
-from transport.unity_transport import send_with_unity_instance
 from transport.legacy.unity_connection import async_send_command_with_retry
 
 
+# Back-to-back create/modify calls (common in agent loops) share one round-trip when
+# UNITY_MCP_BATCH_WINDOW_MS is set.
+_batcher = CommandBatcher("manage_scriptable_object")
+
+_SO_ACTIONS = frozenset(("create", "modify"))
+
+_ERR_TARGET_NOT_OBJECT = "manage_scriptable_object: 'target' must be an object {guid|path} (or JSON string of such)."
+_ERR_PATCHES_NOT_LIST = "manage_scriptable_object: 'patches' must be a list (or JSON string of a list)."
+
+
 @mcp_for_unity_tool(
     description="Creates and modifies ScriptableObject assets using Unity SerializedObject property paths.",
     annotations=ToolAnnotations(
@@ -51,6 +61,10 @@ async def manage_scriptable_object(
     dry_run: Annotated[bool | str | None,
                        "If true, validate patches without applying (modify only)."] = None,
 ) -> dict[str, Any]:
+    # Reject unknown actions before any payload parsing or a Unity round-trip.
+    if action not in _SO_ACTIONS:
+        return {"success": False, "message": f"manage_scriptable_object: unknown action '{action}'. Valid actions: create, modify."}
+
     unity_instance = get_unity_instance_from_context(ctx)
 
     # Tolerate JSON-string payloads (LLMs sometimes stringify complex objects)
@@ -58,30 +72,38 @@ async def manage_scriptable_object(
     parsed_patches = parse_json_payload(patches)
 
     if parsed_target is not None and not isinstance(parsed_target, dict):
-        return {"success": False, "message": "manage_scriptable_object: 'target' must be an object {guid|path} (or JSON string of such)."}
+        return {"success": False, "message": _ERR_TARGET_NOT_OBJECT}
 
     if parsed_patches is not None and not isinstance(parsed_patches, list):
-        return {"success": False, "message": "manage_scriptable_object: 'patches' must be a list (or JSON string of a list)."}
-
-    params: dict[str, Any] = {
-        "action": action,
-        "typeName": type_name,
-        "folderPath": folder_path,
-        "assetName": asset_name,
-        "overwrite": coerce_bool(overwrite, default=None),
-        "target": parsed_target,
-        "patches": parsed_patches,
-        "dryRun": coerce_bool(dry_run, default=None),
-    }
-
-    # Remove None values to keep Unity handler simpler
-    params = {k: v for k, v in params.items() if v is not None}
-
-    response = await send_with_unity_instance(
+        return {"success": False, "message": _ERR_PATCHES_NOT_LIST}
+
+    overwrite = coerce_bool(overwrite, default=None)
+    dry_run = coerce_bool(dry_run, default=None)
+
+    # Only send the keys that were provided, to keep Unity handler simpler
+    params: dict[str, Any] = {"action": action}
+    if type_name is not None:
+        params["typeName"] = type_name
+    if folder_path is not None:
+        params["folderPath"] = folder_path
+    if asset_name is not None:
+        params["assetName"] = asset_name
+    if overwrite is not None:
+        params["overwrite"] = overwrite
+    if parsed_target is not None:
+        params["target"] = parsed_target
+    if parsed_patches is not None:
+        params["patches"] = parsed_patches
+    if dry_run is not None:
+        params["dryRun"] = dry_run
+
+    response = await _batcher.send(
         async_send_command_with_retry,
         unity_instance,
-        "manage_scriptable_object",
         params,
     )
-    await ctx.info(f"Response {response}")
-    return response if isinstance(response, dict) else {"success": False, "message": "Unexpected response from Unity."}
+    # The full response is the tool result already; log only its outcome rather than
+    # formatting the whole (possibly large) patch result into the client log channel.
+    await ctx.info(
+        f"manage_scriptable_object {action}: success={response.get('success')} {response.get('message') or ''}".rstrip())
+    return response
@@ -1,4 +1,3 @@
-import base64
 from typing import Annotated, Any, Literal
 
 from fastmcp import Context
@@ -6,10 +5,14 @@ from mcp.types import ToolAnnotations
 
 from services.registry import mcp_for_unity_tool
 from services.tools import get_unity_instance_from_context
+from services.tools.utils import decode_base64_text
 from transport.unity_transport import send_with_unity_instance
 from transport.legacy.unity_connection import async_send_command_with_retry
 
 
+_SHADER_ACTIONS = frozenset(("create", "read", "update", "delete"))
+
+
 @mcp_for_unity_tool(
     description="Manages shader scripts in Unity (create, read, update, delete). Read-only action: read. Modifying actions: create, update, delete.",
     annotations=ToolAnnotations(
@@ -26,46 +29,42 @@ async def manage_shader(
     contents: Annotated[str,
                         "Shader code for 'create'/'update'"] | None = None,
 ) -> dict[str, Any]:
+    if action not in _SHADER_ACTIONS:
+        return {"success": False, "message": f"Unknown action '{action}'. Valid actions: create, read, update, delete."}
+
     # Get active instance from session state
     # Removed session_state import
     unity_instance = get_unity_instance_from_context(ctx)
     try:
-        # Prepare parameters for Unity
-        params = {
-            "action": action,
-            "name": name,
-            "path": path,
-        }
+        # Prepare parameters for Unity; None values are left out rather than sent as null
+        params: dict[str, Any] = {"action": action}
+        if name is not None:
+            params["name"] = name
+        if path is not None:
+            params["path"] = path
 
-        # Base64 encode the contents if they exist to avoid JSON escaping issues
+        # Send contents as a plain JSON string; the transport escapes it, so base64 would
+        # only add a third to the payload and an encode pass on each side.
         if contents is not None:
-            if action in ['create', 'update']:
-                # Encode content for safer transmission
-                params["encodedContents"] = base64.b64encode(
-                    contents.encode('utf-8')).decode('utf-8')
-                params["contentsEncoded"] = True
-            else:
-                params["contents"] = contents
-
-        # Remove None values so they don't get sent as null
-        params = {k: v for k, v in params.items() if v is not None}
+            params["contents"] = contents
 
         # Send command via centralized retry helper with instance routing
         response = await send_with_unity_instance(async_send_command_with_retry, unity_instance, "manage_shader", params)
 
         # Process response from Unity
-        if isinstance(response, dict) and response.get("success"):
-            # If the response contains base64 encoded content, decode it
-            if response.get("data", {}).get("contentsEncoded"):
-                decoded_contents = base64.b64decode(
-                    response["data"]["encodedContents"]).decode('utf-8')
-                response["data"]["contents"] = decoded_contents
-                del response["data"]["encodedContents"]
-                del response["data"]["contentsEncoded"]
+        if response.get("success"):
+            # Older Unity packages also attach base64 contents to large reads; only decode
+            # them when the plain contents are missing.
+            data = response.get("data")
+            if isinstance(data, dict) and data.get("contentsEncoded"):
+                encoded = data.pop("encodedContents", None)
+                del data["contentsEncoded"]
+                if data.get("contents") is None and encoded:
+                    data["contents"] = decode_base64_text(encoded)
 
             return {"success": True, "message": response.get("message", "Operation successful."), "data": response.get("data")}
-        return response if isinstance(response, dict) else {"success": False, "message": str(response)}
+        return response
 
     except Exception as e:
         # Handle Python-side errors (e.g., connection issues)
-        return {"success": False, "message": f"Python error managing shader: {str(e)}"}
+        return {"success": False, "message": f"Python error managing shader: {e}"}
@@ -1,23 +1,34 @@
-from typing import Annotated, Any, Literal
+import base64
+import os
+import sys
+from array import array
+from typing import Annotated, Any, Literal, Mapping
 
 from fastmcp import Context
 from mcp.types import ToolAnnotations
 
 from services.registry import mcp_for_unity_tool
 from services.tools import get_unity_instance_from_context
+from services.tools.batch_execute import MAX_COMMANDS_PER_BATCH
+from services.tools.command_batcher import CommandBatcher
+from services.tools.utils import parse_json_payload
 from transport.unity_transport import send_with_unity_instance
 from transport.legacy.unity_connection import async_send_command_with_retry
 
+# Setter bursts (set_main, set_emission, set_shape, ...) share one round-trip when
+# UNITY_MCP_BATCH_WINDOW_MS is set.
+_batcher = CommandBatcher("manage_vfx")
+
 # All possible actions grouped by component type
-PARTICLE_ACTIONS = [
+PARTICLE_ACTIONS = (
     "particle_get_info", "particle_set_main", "particle_set_emission", "particle_set_shape",
     "particle_set_color_over_lifetime", "particle_set_size_over_lifetime",
     "particle_set_velocity_over_lifetime", "particle_set_noise", "particle_set_renderer",
     "particle_enable_module", "particle_play", "particle_stop", "particle_pause",
     "particle_restart", "particle_clear", "particle_add_burst", "particle_clear_bursts"
-]
+)
 
-VFX_ACTIONS = [
+VFX_ACTIONS = (
     # Asset management
     "vfx_create_asset", "vfx_assign_asset", "vfx_list_templates", "vfx_list_assets",
     # Runtime control
@@ -26,21 +37,261 @@ VFX_ACTIONS = [
     "vfx_set_gradient", "vfx_set_texture", "vfx_set_mesh", "vfx_set_curve",
     "vfx_send_event", "vfx_play", "vfx_stop", "vfx_pause", "vfx_reinit",
     "vfx_set_playback_speed", "vfx_set_seed"
-]
+)
 
-LINE_ACTIONS = [
+LINE_ACTIONS = (
     "line_get_info", "line_set_positions", "line_add_position", "line_set_position",
     "line_set_width", "line_set_color", "line_set_material", "line_set_properties",
     "line_clear", "line_create_line", "line_create_circle", "line_create_arc", "line_create_bezier"
-]
+)
 
-TRAIL_ACTIONS = [
+TRAIL_ACTIONS = (
     "trail_get_info", "trail_set_time", "trail_set_width", "trail_set_color",
     "trail_set_material", "trail_set_properties", "trail_clear", "trail_emit"
-]
+)
 
-ALL_ACTIONS = ["ping"] + PARTICLE_ACTIONS + \
-    VFX_ACTIONS + LINE_ACTIONS + TRAIL_ACTIONS
+ALL_ACTIONS: frozenset[str] = frozenset(
+    ("ping", *PARTICLE_ACTIONS, *VFX_ACTIONS, *LINE_ACTIONS, *TRAIL_ACTIONS))
+
+# Suggestions shown for an unknown action, matched by its prefix (joined once here)
+_PREFIXES = (
+    ("particle_", ", ".join(PARTICLE_ACTIONS)),
+    ("vfx_", ", ".join(VFX_ACTIONS)),
+    ("line_", ", ".join(LINE_ACTIONS)),
+    ("trail_", ", ".join(TRAIL_ACTIONS)),
+)
+_KNOWN_PREFIXES = tuple(prefix for prefix, _ in _PREFIXES)
+
+
+# Python parameter name -> key expected by the C# ManageVFX handler, in send order.
+# Values pass through untouched; the C# side handles parsing (ParseColor, ParseVector3,
+# ParseMinMaxCurve, ToObject<T>). start_color_line and size_over_lifetime share keys with
+# start_color and size and, coming later, take precedence when both are given.
+_PARAM_MAP: tuple[tuple[str, str], ...] = (
+    # Target
+    ("target", "target"),
+    ("search_method", "searchMethod"),
+    # === PARTICLE SYSTEM ===
+    ("duration", "duration"),
+    ("looping", "looping"),
+    ("prewarm", "prewarm"),
+    ("start_delay", "startDelay"),
+    ("start_lifetime", "startLifetime"),
+    ("start_speed", "startSpeed"),
+    ("start_size", "startSize"),
+    ("start_rotation", "startRotation"),
+    ("start_color", "startColor"),
+    ("gravity_modifier", "gravityModifier"),
+    ("simulation_space", "simulationSpace"),
+    ("scaling_mode", "scalingMode"),
+    ("play_on_awake", "playOnAwake"),
+    ("max_particles", "maxParticles"),
+    # Emission
+    ("rate_over_time", "rateOverTime"),
+    ("rate_over_distance", "rateOverDistance"),
+    # Shape
+    ("shape_type", "shapeType"),
+    ("radius", "radius"),
+    ("radius_thickness", "radiusThickness"),
+    ("angle", "angle"),
+    ("arc", "arc"),
+    # Noise
+    ("strength", "strength"),
+    ("frequency", "frequency"),
+    ("scroll_speed", "scrollSpeed"),
+    ("damping", "damping"),
+    ("octave_count", "octaveCount"),
+    ("quality", "quality"),
+    # Module
+    ("module", "module"),
+    ("enabled", "enabled"),
+    # Burst
+    ("time", "time"),
+    ("count", "count"),
+    ("min_count", "minCount"),
+    ("max_count", "maxCount"),
+    ("cycles", "cycles"),
+    ("interval", "interval"),
+    ("probability", "probability"),
+    # Playback
+    ("with_children", "withChildren"),
+    # === VFX GRAPH ===
+    # Asset management parameters
+    ("asset_name", "assetName"),
+    ("folder_path", "folderPath"),
+    ("template", "template"),
+    ("asset_path", "assetPath"),
+    ("overwrite", "overwrite"),
+    ("folder", "folder"),
+    ("search", "search"),
+    # Runtime parameters
+    ("parameter", "parameter"),
+    ("value", "value"),
+    ("texture_path", "texturePath"),
+    ("mesh_path", "meshPath"),
+    ("gradient", "gradient"),
+    ("curve", "curve"),
+    ("event_name", "eventName"),
+    ("velocity", "velocity"),
+    ("size", "size"),
+    ("lifetime", "lifetime"),
+    ("play_rate", "playRate"),
+    ("seed", "seed"),
+    ("reset_seed_on_play", "resetSeedOnPlay"),
+    # === LINE/TRAIL RENDERER ===
+    ("positions", "positions"),
+    ("position", "position"),
+    ("index", "index"),
+    # Width
+    ("width", "width"),
+    ("start_width", "startWidth"),
+    ("end_width", "endWidth"),
+    ("width_curve", "widthCurve"),
+    ("width_multiplier", "widthMultiplier"),
+    # Color
+    ("color", "color"),
+    ("start_color_line", "startColor"),
+    ("end_color", "endColor"),
+    # Material & properties
+    ("material_path", "materialPath"),
+    ("trail_material_path", "trailMaterialPath"),
+    ("loop", "loop"),
+    ("use_world_space", "useWorldSpace"),
+    ("num_corner_vertices", "numCornerVertices"),
+    ("num_cap_vertices", "numCapVertices"),
+    ("alignment", "alignment"),
+    ("texture_mode", "textureMode"),
+    ("generate_lighting_data", "generateLightingData"),
+    ("sorting_order", "sortingOrder"),
+    ("sorting_layer_name", "sortingLayerName"),
+    ("sorting_layer_id", "sortingLayerID"),
+    ("render_mode", "renderMode"),
+    ("sort_mode", "sortMode"),
+    # Renderer common properties (shadows, lighting, probes)
+    ("shadow_casting_mode", "shadowCastingMode"),
+    ("receive_shadows", "receiveShadows"),
+    ("shadow_bias", "shadowBias"),
+    ("light_probe_usage", "lightProbeUsage"),
+    ("reflection_probe_usage", "reflectionProbeUsage"),
+    ("motion_vector_generation_mode", "motionVectorGenerationMode"),
+    ("rendering_layer_mask", "renderingLayerMask"),
+    # Particle renderer specific
+    ("min_particle_size", "minParticleSize"),
+    ("max_particle_size", "maxParticleSize"),
+    ("length_scale", "lengthScale"),
+    ("velocity_scale", "velocityScale"),
+    ("camera_velocity_scale", "cameraVelocityScale"),
+    ("normal_direction", "normalDirection"),
+    ("pivot", "pivot"),
+    ("flip", "flip"),
+    ("allow_roll", "allowRoll"),
+    # Shape creation
+    ("start", "start"),
+    ("end", "end"),
+    ("center", "center"),
+    ("segments", "segments"),
+    ("normal", "normal"),
+    ("start_angle", "startAngle"),
+    ("end_angle", "endAngle"),
+    ("control_point1", "controlPoint1"),
+    ("control_point2", "controlPoint2"),
+    # Trail specific
+    ("min_vertex_distance", "minVertexDistance"),
+    ("autodestruct", "autodestruct"),
+    ("emitting", "emitting"),
+    # Velocity/size axes
+    ("x", "x"),
+    ("y", "y"),
+    ("z", "z"),
+    ("speed_modifier", "speedModifier"),
+    ("space", "space"),
+    ("separate_axes", "separateAxes"),
+    ("size_over_lifetime", "size"),
+    ("size_x", "sizeX"),
+    ("size_y", "sizeY"),
+    ("size_z", "sizeZ"),
+)
+
+_PARAM_NAMES = frozenset(py_name for py_name, _ in _PARAM_MAP)
+
+# Shorter position lists stay as JSON; packing only pays off for long lines.
+_PACK_POSITIONS_MIN = 64
+
+
+def _pack_positions_enabled() -> bool:
+    """
+    Packed positions are opt-in via UNITY_MCP_PACK_LINE_POSITIONS: Unity packages that predate
+    positionsBin only read 'positions' and would reject a packed request.
+    """
+    return os.environ.get("UNITY_MCP_PACK_LINE_POSITIONS", "").lower() in ("true", "1", "yes", "on")
+
+
+def _pack_positions(positions: Any) -> str | None:
+    """
+    Pack [[x, y, z], ...] as base64 little-endian float32s for line_set_positions, which
+    Unity copies straight into a Vector3[]. Returns None for short lists and ones with
+    non-numeric or out-of-range coordinates.
+    """
+    if not isinstance(positions, list) or len(positions) < _PACK_POSITIONS_MIN:
+        return None
+    flat = array("f")
+    try:
+        for point in positions:
+            if not isinstance(point, (list, tuple)) or len(point) != 3:
+                return None
+            flat.extend(point)
+    except (TypeError, OverflowError):
+        # OverflowError: a coordinate (e.g. a huge int) does not fit in a float32
+        return None
+    if sys.byteorder != "little":
+        flat.byteswap()
+    return base64.b64encode(flat.tobytes()).decode("ascii")
+
+
+def _build_params(action_normalized: str, args: Mapping[str, Any]) -> dict[str, Any]:
+    """Map the non-None tool arguments in args to the keys the C# handler reads."""
+    params_dict: dict[str, Any] = {"action": action_normalized}
+    for py_name, cs_name in _PARAM_MAP:
+        arg = args.get(py_name)
+        if arg is not None:
+            params_dict[cs_name] = arg
+    if action_normalized == "line_set_positions" and _pack_positions_enabled():
+        packed = _pack_positions(params_dict.get("positions"))
+        if packed is not None:
+            del params_dict["positions"]
+            params_dict["positionsBin"] = packed
+    return params_dict
+
+
+def _build_batch_commands(
+    actions: Any, target: str | None, search_method: str | None
+) -> tuple[list[dict[str, Any]] | None, str | None]:
+    """
+    Turn action='batch' sub-actions into batch_execute commands for manage_vfx.
+    Returns (commands, error_message).
+    """
+    if not isinstance(actions, list) or not actions:
+        return None, "action='batch' requires 'actions': a non-empty list of {action, ...params} objects."
+    if len(actions) > MAX_COMMANDS_PER_BATCH:
+        return None, f"action='batch' supports up to {MAX_COMMANDS_PER_BATCH} actions; received {len(actions)}."
+
+    commands: list[dict[str, Any]] = []
+    for index, entry in enumerate(actions):
+        if not isinstance(entry, dict):
+            return None, f"actions[{index}] must be an object with an 'action' key."
+        sub_action = entry.get("action")
+        if not isinstance(sub_action, str) or sub_action.lower() not in ALL_ACTIONS:
+            return None, f"actions[{index}] has unknown action {sub_action!r}."
+        unknown = entry.keys() - _PARAM_NAMES - {"action"}
+        if unknown:
+            return None, f"actions[{index}] has unknown parameters: {', '.join(sorted(unknown))}."
+        # Top-level target/search_method apply to every entry that doesn't set its own
+        if target is not None and entry.get("target") is None:
+            entry = {**entry, "target": target}
+        if search_method is not None and entry.get("search_method") is None:
+            entry = {**entry, "search_method": search_method}
+        commands.append({"tool": "manage_vfx", "params": _build_params(sub_action.lower(), entry)})
+    return commands, None
 
 
 @mcp_for_unity_tool(
@@ -118,7 +369,10 @@ Use `target` parameter to specify the GameObject:
 - trail_set_time: Set trail duration
 - trail_set_width, trail_set_color, trail_set_material, trail_set_properties
 - trail_clear: Clear trail
-- trail_emit: Emit point (Unity 2021.1+)""",
+- trail_emit: Emit point (Unity 2021.1+)
+
+**Batching:**
+- batch: Run several actions in order in one Unity round-trip. Pass `actions` as a list of {action, ...params} dicts using this tool's parameter names, e.g. `[{"action": "particle_set_main", "duration": 2}, {"action": "particle_play"}]`. Top-level `target`/`search_method` apply to entries that don't set their own (max 25 actions).""",
     annotations=ToolAnnotations(
         title="Manage VFX",
         destructiveHint=True,
@@ -126,7 +380,7 @@ Use `target` parameter to specify the GameObject:
 )
 async def manage_vfx(
     ctx: Context,
-    action: Annotated[str, "Action to perform. Use prefix: particle_, vfx_, line_, or trail_"],
+    action: Annotated[str, "Action to perform. Use prefix: particle_, vfx_, line_, or trail_ (or 'batch' with actions)"],
 
     # Target specification (common) - REQUIRED for most actions
     # Using str | None to accept any string format
@@ -137,6 +391,10 @@ async def manage_vfx(
         "How to find target: by_name (default), by_path (hierarchy path), by_id (instance ID - most reliable), by_tag, by_layer"
     ] = None,
 
+    # Batch
+    actions: Annotated[list[dict[str, Any]] | str | None,
+                       "[Batch] For action='batch': list of {action, ...params} dicts (or JSON string) run in order in one round-trip"] = None,
+
     # === PARTICLE SYSTEM PARAMETERS ===
     # Main module - All use Any to accept string coercion from MCP clients
     duration: Annotated[Any,
@@ -406,25 +664,34 @@ async def manage_vfx(
 ) -> dict[str, Any]:
     """Unified VFX management tool."""
 
-    # Normalize action to lowercase to match Unity-side behavior
-    action_normalized = action.lower()
+    # Normalize action to lowercase to match Unity-side behavior (documented actions
+    # already are, so skip the copy for them)
+    action_normalized = action if action in ALL_ACTIONS else action.lower()
+
+    if action_normalized == "batch":
+        commands, batch_error = _build_batch_commands(
+            parse_json_payload(actions), target, search_method)
+        if batch_error:
+            return {"success": False, "message": batch_error}
+        return await send_with_unity_instance(
+            async_send_command_with_retry,
+            get_unity_instance_from_context(ctx),
+            "batch_execute",
+            # Params are already keyed for ManageVFX; don't camelCase them again.
+            {"commands": commands, "normalizeKeys": False},
+        )
+    if actions is not None:
+        return {"success": False, "message": "'actions' is only used with action='batch'."}
 
     # Validate action against known actions using normalized value
     if action_normalized not in ALL_ACTIONS:
         # Provide helpful error with closest matches by prefix
-        prefix = action_normalized.split(
-            "_")[0] + "_" if "_" in action_normalized else ""
-        available_by_prefix = {
-            "particle_": PARTICLE_ACTIONS,
-            "vfx_": VFX_ACTIONS,
-            "line_": LINE_ACTIONS,
-            "trail_": TRAIL_ACTIONS,
-        }
-        suggestions = available_by_prefix.get(prefix, [])
-        if suggestions:
+        if action_normalized.startswith(_KNOWN_PREFIXES):
+            prefix, suggestions = next(
+                entry for entry in _PREFIXES if action_normalized.startswith(entry[0]))
             return {
                 "success": False,
-                "message": f"Unknown action '{action}'. Available {prefix}* actions: {', '.join(suggestions)}",
+                "message": f"Unknown action '{action}'. Available {prefix}* actions: {suggestions}",
             }
         else:
             return {
@@ -437,301 +704,18 @@ async def manage_vfx(
 
     unity_instance = get_unity_instance_from_context(ctx)
 
-    # Build parameters dict with normalized action to stay consistent with Unity
-    params_dict: dict[str, Any] = {"action": action_normalized}
-
-    # Target
-    if target is not None:
-        params_dict["target"] = target
-    if search_method is not None:
-        params_dict["searchMethod"] = search_method
-
-    # === PARTICLE SYSTEM ===
-    # Pass through all values - C# side handles parsing (ParseColor, ParseVector3, ParseMinMaxCurve, ToObject<T>)
-    if duration is not None:
-        params_dict["duration"] = duration
-    if looping is not None:
-        params_dict["looping"] = looping
-    if prewarm is not None:
-        params_dict["prewarm"] = prewarm
-    if start_delay is not None:
-        params_dict["startDelay"] = start_delay
-    if start_lifetime is not None:
-        params_dict["startLifetime"] = start_lifetime
-    if start_speed is not None:
-        params_dict["startSpeed"] = start_speed
-    if start_size is not None:
-        params_dict["startSize"] = start_size
-    if start_rotation is not None:
-        params_dict["startRotation"] = start_rotation
-    if start_color is not None:
-        params_dict["startColor"] = start_color
-    if gravity_modifier is not None:
-        params_dict["gravityModifier"] = gravity_modifier
-    if simulation_space is not None:
-        params_dict["simulationSpace"] = simulation_space
-    if scaling_mode is not None:
-        params_dict["scalingMode"] = scaling_mode
-    if play_on_awake is not None:
-        params_dict["playOnAwake"] = play_on_awake
-    if max_particles is not None:
-        params_dict["maxParticles"] = max_particles
-
-    # Emission
-    if rate_over_time is not None:
-        params_dict["rateOverTime"] = rate_over_time
-    if rate_over_distance is not None:
-        params_dict["rateOverDistance"] = rate_over_distance
+    # Connectivity probe: ignores every other parameter, so skip gathering them
+    if action_normalized == "ping":
+        return await send_with_unity_instance(
+            async_send_command_with_retry, unity_instance, "manage_vfx", {"action": "ping"})
 
-    # Shape
-    if shape_type is not None:
-        params_dict["shapeType"] = shape_type
-    if radius is not None:
-        params_dict["radius"] = radius
-    if radius_thickness is not None:
-        params_dict["radiusThickness"] = radius_thickness
-    if angle is not None:
-        params_dict["angle"] = angle
-    if arc is not None:
-        params_dict["arc"] = arc
-
-    # Noise
-    if strength is not None:
-        params_dict["strength"] = strength
-    if frequency is not None:
-        params_dict["frequency"] = frequency
-    if scroll_speed is not None:
-        params_dict["scrollSpeed"] = scroll_speed
-    if damping is not None:
-        params_dict["damping"] = damping
-    if octave_count is not None:
-        params_dict["octaveCount"] = octave_count
-    if quality is not None:
-        params_dict["quality"] = quality
-
-    # Module
-    if module is not None:
-        params_dict["module"] = module
-    if enabled is not None:
-        params_dict["enabled"] = enabled
-
-    # Burst
-    if time is not None:
-        params_dict["time"] = time
-    if count is not None:
-        params_dict["count"] = count
-    if min_count is not None:
-        params_dict["minCount"] = min_count
-    if max_count is not None:
-        params_dict["maxCount"] = max_count
-    if cycles is not None:
-        params_dict["cycles"] = cycles
-    if interval is not None:
-        params_dict["interval"] = interval
-    if probability is not None:
-        params_dict["probability"] = probability
-
-    # Playback
-    if with_children is not None:
-        params_dict["withChildren"] = with_children
-
-    # === VFX GRAPH ===
-    # Asset management parameters
-    if asset_name is not None:
-        params_dict["assetName"] = asset_name
-    if folder_path is not None:
-        params_dict["folderPath"] = folder_path
-    if template is not None:
-        params_dict["template"] = template
-    if asset_path is not None:
-        params_dict["assetPath"] = asset_path
-    if overwrite is not None:
-        params_dict["overwrite"] = overwrite
-    if folder is not None:
-        params_dict["folder"] = folder
-    if search is not None:
-        params_dict["search"] = search
-
-    # Runtime parameters
-    if parameter is not None:
-        params_dict["parameter"] = parameter
-    if value is not None:
-        params_dict["value"] = value
-    if texture_path is not None:
-        params_dict["texturePath"] = texture_path
-    if mesh_path is not None:
-        params_dict["meshPath"] = mesh_path
-    if gradient is not None:
-        params_dict["gradient"] = gradient
-    if curve is not None:
-        params_dict["curve"] = curve
-    if event_name is not None:
-        params_dict["eventName"] = event_name
-    if velocity is not None:
-        params_dict["velocity"] = velocity
-    if size is not None:
-        params_dict["size"] = size
-    if lifetime is not None:
-        params_dict["lifetime"] = lifetime
-    if play_rate is not None:
-        params_dict["playRate"] = play_rate
-    if seed is not None:
-        params_dict["seed"] = seed
-    if reset_seed_on_play is not None:
-        params_dict["resetSeedOnPlay"] = reset_seed_on_play
-
-    # === LINE/TRAIL RENDERER ===
-    if positions is not None:
-        params_dict["positions"] = positions
-    if position is not None:
-        params_dict["position"] = position
-    if index is not None:
-        params_dict["index"] = index
-
-    # Width
-    if width is not None:
-        params_dict["width"] = width
-    if start_width is not None:
-        params_dict["startWidth"] = start_width
-    if end_width is not None:
-        params_dict["endWidth"] = end_width
-    if width_curve is not None:
-        params_dict["widthCurve"] = width_curve
-    if width_multiplier is not None:
-        params_dict["widthMultiplier"] = width_multiplier
-
-    # Color
-    if color is not None:
-        params_dict["color"] = color
-    if start_color_line is not None:
-        params_dict["startColor"] = start_color_line
-    if end_color is not None:
-        params_dict["endColor"] = end_color
-
-    # Material & properties
-    if material_path is not None:
-        params_dict["materialPath"] = material_path
-    if trail_material_path is not None:
-        params_dict["trailMaterialPath"] = trail_material_path
-    if loop is not None:
-        params_dict["loop"] = loop
-    if use_world_space is not None:
-        params_dict["useWorldSpace"] = use_world_space
-    if num_corner_vertices is not None:
-        params_dict["numCornerVertices"] = num_corner_vertices
-    if num_cap_vertices is not None:
-        params_dict["numCapVertices"] = num_cap_vertices
-    if alignment is not None:
-        params_dict["alignment"] = alignment
-    if texture_mode is not None:
-        params_dict["textureMode"] = texture_mode
-    if generate_lighting_data is not None:
-        params_dict["generateLightingData"] = generate_lighting_data
-    if sorting_order is not None:
-        params_dict["sortingOrder"] = sorting_order
-    if sorting_layer_name is not None:
-        params_dict["sortingLayerName"] = sorting_layer_name
-    if sorting_layer_id is not None:
-        params_dict["sortingLayerID"] = sorting_layer_id
-    if render_mode is not None:
-        params_dict["renderMode"] = render_mode
-    if sort_mode is not None:
-        params_dict["sortMode"] = sort_mode
-
-    # Renderer common properties (shadows, lighting, probes)
-    if shadow_casting_mode is not None:
-        params_dict["shadowCastingMode"] = shadow_casting_mode
-    if receive_shadows is not None:
-        params_dict["receiveShadows"] = receive_shadows
-    if shadow_bias is not None:
-        params_dict["shadowBias"] = shadow_bias
-    if light_probe_usage is not None:
-        params_dict["lightProbeUsage"] = light_probe_usage
-    if reflection_probe_usage is not None:
-        params_dict["reflectionProbeUsage"] = reflection_probe_usage
-    if motion_vector_generation_mode is not None:
-        params_dict["motionVectorGenerationMode"] = motion_vector_generation_mode
-    if rendering_layer_mask is not None:
-        params_dict["renderingLayerMask"] = rendering_layer_mask
-
-    # Particle renderer specific
-    if min_particle_size is not None:
-        params_dict["minParticleSize"] = min_particle_size
-    if max_particle_size is not None:
-        params_dict["maxParticleSize"] = max_particle_size
-    if length_scale is not None:
-        params_dict["lengthScale"] = length_scale
-    if velocity_scale is not None:
-        params_dict["velocityScale"] = velocity_scale
-    if camera_velocity_scale is not None:
-        params_dict["cameraVelocityScale"] = camera_velocity_scale
-    if normal_direction is not None:
-        params_dict["normalDirection"] = normal_direction
-    if pivot is not None:
-        params_dict["pivot"] = pivot
-    if flip is not None:
-        params_dict["flip"] = flip
-    if allow_roll is not None:
-        params_dict["allowRoll"] = allow_roll
-
-    # Shape creation
-    if start is not None:
-        params_dict["start"] = start
-    if end is not None:
-        params_dict["end"] = end
-    if center is not None:
-        params_dict["center"] = center
-    if segments is not None:
-        params_dict["segments"] = segments
-    if normal is not None:
-        params_dict["normal"] = normal
-    if start_angle is not None:
-        params_dict["startAngle"] = start_angle
-    if end_angle is not None:
-        params_dict["endAngle"] = end_angle
-    if control_point1 is not None:
-        params_dict["controlPoint1"] = control_point1
-    if control_point2 is not None:
-        params_dict["controlPoint2"] = control_point2
-
-    # Trail specific
-    if min_vertex_distance is not None:
-        params_dict["minVertexDistance"] = min_vertex_distance
-    if autodestruct is not None:
-        params_dict["autodestruct"] = autodestruct
-    if emitting is not None:
-        params_dict["emitting"] = emitting
+    # Build parameters dict with normalized action to stay consistent with Unity
+    params_dict = _build_params(action_normalized, locals())
 
-    # Velocity/size axes
-    if x is not None:
-        params_dict["x"] = x
-    if y is not None:
-        params_dict["y"] = y
-    if z is not None:
-        params_dict["z"] = z
-    if speed_modifier is not None:
-        params_dict["speedModifier"] = speed_modifier
-    if space is not None:
-        params_dict["space"] = space
-    if separate_axes is not None:
-        params_dict["separateAxes"] = separate_axes
-    if size_over_lifetime is not None:
-        params_dict["size"] = size_over_lifetime
-    if size_x is not None:
-        params_dict["sizeX"] = size_x
-    if size_y is not None:
-        params_dict["sizeY"] = size_y
-    if size_z is not None:
-        params_dict["sizeZ"] = size_z
-
-    # Remove None values
-    params_dict = {k: v for k, v in params_dict.items() if v is not None}
-
-    # Send to Unity
-    result = await send_with_unity_instance(
+    # Send to Unity (coalesced with concurrent calls when enabled)
+    result = await _batcher.send(
         async_send_command_with_retry,
         unity_instance,
-        "manage_vfx",
         params_dict,
     )
 
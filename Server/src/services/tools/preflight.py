@@ -5,7 +5,29 @@ import os
 import time
 from typing import Any
 
+import services.resources.editor_state as editor_state
 from models import MCPResponse
+from services.tools import get_unity_instance_from_context
+
+# Consecutive tool calls within one agent turn share a passed gate for this long.
+_GATE_TTL_S = 0.2
+# (unity_instance, requires_no_tests, wait_for_no_compile, refresh_if_dirty) -> monotonic time the gate passed
+_gate_cache: dict[tuple[str | None, bool, bool, bool], float] = {}
+
+# Gates with different flags (e.g. one tool waiting on compiles, the next checking tests) reuse
+# an editor-state snapshot this recent instead of fetching it again.
+_STATE_TTL_S = 0.5
+# unity_instance -> (monotonic fetch time, editor_state data dict or None)
+_state_cache: dict[str | None, tuple[float, dict[str, Any] | None]] = {}
+
+# Editor-state polling backs off from POLL_INITIAL_S by POLL_BACKOFF per poll, up to POLL_MAX_S:
+# short waits still resolve quickly, long domain reloads don't fetch state 4x a second.
+POLL_INITIAL_S = 0.1
+POLL_MAX_S = 1.0
+POLL_BACKOFF = 1.5
+
+# Stand-in for editor_state sections that are absent (None) in a snapshot; never mutated.
+_EMPTY: dict[str, Any] = {}
 
 
 def _in_pytest() -> bool:
@@ -14,6 +36,36 @@ def _in_pytest() -> bool:
     return bool(os.environ.get("PYTEST_CURRENT_TEST"))
 
 
+def invalidate_preflight_cache() -> None:
+    """
+    Forget recently passed gates and cached editor-state snapshots for every instance.
+    Called after refresh_unity and successful script writes, which may trigger compilation.
+    """
+    _gate_cache.clear()
+    _state_cache.clear()
+
+
+async def _load_editor_state(ctx, unity_instance: str | None, *, fresh: bool = False) -> dict[str, Any] | None:
+    """
+    Return the editor_state data dict, or None when the state is unavailable.
+
+    Reuses a snapshot younger than _STATE_TTL_S unless fresh. The snapshot cache is
+    process-global and keyed by unity_instance, so concurrent sessions targeting the same
+    instance share it; invalidate_preflight_cache() clears it for all instances.
+    """
+    if not fresh:
+        cached = _state_cache.get(unity_instance)
+        if cached is not None and time.monotonic() - cached[0] < _STATE_TTL_S:
+            return cached[1]
+    state_resp = await editor_state.get_editor_state(ctx)
+    # Read fields off the response model rather than dumping the whole snapshot on every poll.
+    data = state_resp.data if state_resp.success else None
+    if not isinstance(data, dict):
+        data = None
+    _state_cache[unity_instance] = (time.monotonic(), data)
+    return data
+
+
 def _busy(reason: str, retry_after_ms: int) -> MCPResponse:
     return MCPResponse(
         success=False,
@@ -42,28 +94,27 @@ async def preflight(
     if _in_pytest():
         return None
 
+    unity_instance = get_unity_instance_from_context(ctx)
+    gate_key = (unity_instance, requires_no_tests,
+                wait_for_no_compile, refresh_if_dirty)
+    passed_at = _gate_cache.get(gate_key)
+    if passed_at is not None and time.monotonic() - passed_at < _GATE_TTL_S:
+        return None
+
     # Load canonical editor state (server enriches advice + staleness).
     try:
-        from services.resources.editor_state import get_editor_state
-        state_resp = await get_editor_state(ctx)
-        state = state_resp.model_dump() if hasattr(
-            state_resp, "model_dump") else state_resp
+        data = await _load_editor_state(ctx, unity_instance)
     except Exception:
         # If we cannot determine readiness, fall back to proceeding (tools already contain retry logic).
         return None
 
-    if not isinstance(state, dict) or not state.get("success", False):
+    if data is None:
         # Unknown state; proceed rather than blocking (avoids false positives when Unity is reachable but status isn't).
         return None
 
-    data = state.get("data")
-    if not isinstance(data, dict):
-        return None
-
     # Optional refresh-if-dirty
     if refresh_if_dirty:
-        assets = data.get("assets")
-        if isinstance(assets, dict) and assets.get("external_changes_dirty") is True:
+        if (data.get("assets") or _EMPTY).get("external_changes_dirty") is True:
             try:
                 from services.tools.refresh_unity import refresh_unity
                 await refresh_unity(ctx, mode="if_dirty", scope="all", compile="request", wait_for_ready=True)
@@ -73,38 +124,32 @@ async def preflight(
 
     # Tests running: fail fast for tools that require exclusivity.
     if requires_no_tests:
-        tests = data.get("tests")
-        if isinstance(tests, dict) and tests.get("is_running") is True:
+        if (data.get("tests") or _EMPTY).get("is_running") is True:
             return _busy("tests_running", 5000)
 
     # Compilation: optionally wait for a bounded time.
     if wait_for_no_compile:
         deadline = time.monotonic() + float(max_wait_s)
+        delay = POLL_INITIAL_S
         while True:
-            compilation = data.get("compilation") if isinstance(
-                data, dict) else None
-            is_compiling = isinstance(compilation, dict) and compilation.get(
-                "is_compiling") is True
-            is_domain_reload_pending = isinstance(compilation, dict) and compilation.get(
-                "is_domain_reload_pending") is True
-            if not is_compiling and not is_domain_reload_pending:
+            compilation = data.get("compilation") or _EMPTY
+            if compilation.get("is_compiling") is not True and compilation.get("is_domain_reload_pending") is not True:
                 break
-            if time.monotonic() >= deadline:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
                 return _busy("compiling", 500)
-            await asyncio.sleep(0.25)
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * POLL_BACKOFF, POLL_MAX_S)
 
             # Refresh state for the next loop iteration.
             try:
-                from services.resources.editor_state import get_editor_state
-                state_resp = await get_editor_state(ctx)
-                state = state_resp.model_dump() if hasattr(
-                    state_resp, "model_dump") else state_resp
-                data = state.get("data") if isinstance(state, dict) else None
-                if not isinstance(data, dict):
+                data = await _load_editor_state(ctx, unity_instance, fresh=True)
+                if data is None:
                     return None
             except Exception:
                 return None
 
     # Staleness: if the snapshot is stale, proceed (tools will still run), but callers that read resources can back off.
     # In future we may make this strict for some tools.
+    _gate_cache[gate_key] = time.monotonic()
     return None
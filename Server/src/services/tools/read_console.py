@@ -76,26 +76,24 @@ async def read_console(
     if action == "get" and count is None:
         count = 10
 
-    # Prepare parameters for the C# handler
-    params_dict = {
+    # Prepare parameters for the C# handler. count is always sent: an explicit null
+    # (count="all") is what asks the C# side for every entry.
+    params_dict: dict[str, Any] = {
         "action": action,
         "types": types,
         "count": count,
-        "filterText": filter_text,
-        "sinceTimestamp": since_timestamp,
-        "pageSize": coerced_page_size,
-        "cursor": coerced_cursor,
         "format": format.lower() if isinstance(format, str) else format,
-        "includeStacktrace": include_stacktrace
+        "includeStacktrace": include_stacktrace,
     }
-
-    # Remove None values unless it's 'count' (as None might mean 'all')
-    params_dict = {k: v for k, v in params_dict.items()
-                   if v is not None or k == 'count'}
-
-    # Add count back if it was None, explicitly sending null might be important for C# logic
-    if 'count' not in params_dict:
-        params_dict['count'] = None
+    # Optional filters/paging are only sent when provided
+    if filter_text is not None:
+        params_dict["filterText"] = filter_text
+    if since_timestamp is not None:
+        params_dict["sinceTimestamp"] = since_timestamp
+    if coerced_page_size is not None:
+        params_dict["pageSize"] = coerced_page_size
+    if coerced_cursor is not None:
+        params_dict["cursor"] = coerced_cursor
 
     # Use centralized retry helper with instance routing
     resp = await send_with_unity_instance(async_send_command_with_retry, unity_instance, "read_console", params_dict)
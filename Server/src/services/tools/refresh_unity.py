@@ -13,6 +13,7 @@ from services.tools import get_unity_instance_from_context
 import transport.unity_transport as unity_transport
 from transport.legacy.unity_connection import async_send_command_with_retry, _extract_response_reason
 from services.state.external_changes_scanner import external_changes_scanner
+from services.tools.preflight import POLL_BACKOFF, POLL_INITIAL_S, POLL_MAX_S, invalidate_preflight_cache
 import services.resources.editor_state as editor_state
 
 
@@ -32,7 +33,7 @@ async def refresh_unity(
                        "Whether to request compilation"] = "none",
     wait_for_ready: Annotated[bool,
                               "If true, wait until editor_state.advice.ready_for_tools is true"] = True,
-) -> MCPResponse | dict[str, Any]:
+) -> MCPResponse:
     unity_instance = get_unity_instance_from_context(ctx)
 
     params: dict[str, Any] = {
@@ -43,6 +44,7 @@ async def refresh_unity(
     }
 
     recovered_from_disconnect = False
+    invalidate_preflight_cache()
     response = await unity_transport.send_with_unity_instance(
         async_send_command_with_retry,
         unity_instance,
@@ -53,7 +55,7 @@ async def refresh_unity(
     # Option A: treat disconnects / retry hints as recoverable when wait_for_ready is true.
     # Unity can legitimately disconnect during refresh/compile/domain reload, so callers should not
     # interpret that as a hard failure (#503-style loops).
-    if isinstance(response, dict) and not response.get("success", True):
+    if not response.get("success", True):
         hint = response.get("hint")
         err = (response.get("error") or response.get("message") or "")
         reason = _extract_response_reason(response)
@@ -68,25 +70,28 @@ async def refresh_unity(
     # poll the canonical editor_state resource until ready or timeout.
     if wait_for_ready:
         timeout_s = 60.0
-        start = time.monotonic()
+        deadline = time.monotonic() + timeout_s
+        delay = POLL_INITIAL_S
 
-        while time.monotonic() - start < timeout_s:
+        while True:
             state_resp = await editor_state.get_editor_state(ctx)
-            state = state_resp.model_dump() if hasattr(
-                state_resp, "model_dump") else state_resp
-            data = (state or {}).get("data") if isinstance(
-                state, dict) else None
-            advice = (data or {}).get(
-                "advice") if isinstance(data, dict) else None
+            data = state_resp.data
+            advice = data.get("advice") if isinstance(data, dict) else None
             if isinstance(advice, dict) and advice.get("ready_for_tools") is True:
                 break
-            await asyncio.sleep(0.25)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * POLL_BACKOFF, POLL_MAX_S)
 
     # After readiness is restored, clear any external-dirty flag for this instance so future tools can proceed cleanly.
     try:
         inst = unity_instance or await editor_state.infer_single_instance_id(ctx)
         if inst:
             external_changes_scanner.clear_dirty(inst)
+            # Cached editor state still reports the cleared dirty flag.
+            invalidate_preflight_cache()
     except Exception:
         pass
 
@@ -97,4 +102,4 @@ async def refresh_unity(
             data={"recovered_from_disconnect": True},
         )
 
-    return MCPResponse(**response) if isinstance(response, dict) else response
+    return MCPResponse(**response)
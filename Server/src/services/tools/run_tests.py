@@ -88,6 +88,23 @@ class GetTestJobResponse(MCPResponse):
     data: GetTestJobData | None = None
 
 
+# Job statuses after which polling stops.
+_TERMINAL_STATES = frozenset(("succeeded", "failed", "cancelled"))
+# Shared stand-in for a missing "data" payload; never mutated.
+_EMPTY: dict[str, Any] = {}
+
+
+def _coerce_string_list(value) -> list[str] | None:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return [value] if value.strip() else None
+    if isinstance(value, list):
+        result = [str(v).strip() for v in value if v and str(v).strip()]
+        return result if result else None
+    return None
+
+
 @mcp_for_unity_tool(
     description="Starts a Unity test run asynchronously and returns a job_id immediately. Poll with get_test_job for progress.",
     annotations=ToolAnnotations(
@@ -118,25 +135,15 @@ async def run_tests(
     if isinstance(gate, MCPResponse):
         return gate
 
-    def _coerce_string_list(value) -> list[str] | None:
-        if value is None:
-            return None
-        if isinstance(value, str):
-            return [value] if value.strip() else None
-        if isinstance(value, list):
-            result = [str(v).strip() for v in value if v and str(v).strip()]
-            return result if result else None
-        return None
-
     params: dict[str, Any] = {"mode": mode}
-    if (t := _coerce_string_list(test_names)):
-        params["testNames"] = t
-    if (g := _coerce_string_list(group_names)):
-        params["groupNames"] = g
-    if (c := _coerce_string_list(category_names)):
-        params["categoryNames"] = c
-    if (a := _coerce_string_list(assembly_names)):
-        params["assemblyNames"] = a
+    for key, raw in (
+        ("testNames", test_names),
+        ("groupNames", group_names),
+        ("categoryNames", category_names),
+        ("assemblyNames", assembly_names),
+    ):
+        if (values := _coerce_string_list(raw)):
+            params[key] = values
     if include_failed_tests:
         params["includeFailedTests"] = True
     if include_details:
@@ -193,7 +200,8 @@ async def get_test_job(
 
     # If wait_timeout is specified, poll server-side until complete or timeout
     if wait_timeout and wait_timeout > 0:
-        deadline = asyncio.get_event_loop().time() + wait_timeout
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + wait_timeout
         poll_interval = 2.0  # Poll Unity every 2 seconds
         
         while True:
@@ -206,13 +214,12 @@ async def get_test_job(
                 return MCPResponse(**response)
             
             # Check if tests are done
-            data = response.get("data", {})
-            status = data.get("status", "")
-            if status in ("succeeded", "failed", "cancelled"):
+            data = response.get("data") or _EMPTY
+            if data.get("status") in _TERMINAL_STATES:
                 return GetTestJobResponse(**response)
             
             # Check timeout
-            remaining = deadline - asyncio.get_event_loop().time()
+            remaining = deadline - loop.time()
             if remaining <= 0:
                 # Timeout reached, return current status
                 return GetTestJobResponse(**response)
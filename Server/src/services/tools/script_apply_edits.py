@@ -8,6 +8,7 @@ from mcp.types import ToolAnnotations
 
 from services.registry import mcp_for_unity_tool
 from services.tools import get_unity_instance_from_context
+from services.tools.preflight import invalidate_preflight_cache
 from services.tools.utils import parse_json_payload
 from transport.unity_transport import send_with_unity_instance
 from transport.legacy.unity_connection import async_send_command_with_retry
@@ -611,7 +612,8 @@ async def script_apply_edits(
             params_struct,
         )
         if isinstance(resp_struct, dict) and resp_struct.get("success"):
-            pass  # Optional sentinel reload removed (deprecated)
+            # The write can start a compile; drop preflight passes cached before it.
+            invalidate_preflight_cache()
         return _with_norm(resp_struct if isinstance(resp_struct, dict) else {"success": False, "message": str(resp_struct)}, normalized_for_echo, routing="structured")
 
     # 1) read from Unity
@@ -752,7 +754,7 @@ async def script_apply_edits(
                 )
                 if not (isinstance(resp_text, dict) and resp_text.get("success")):
                     return _with_norm(resp_text if isinstance(resp_text, dict) else {"success": False, "message": str(resp_text)}, normalized_for_echo, routing="mixed/text-first")
-                # Optional sentinel reload removed (deprecated)
+                invalidate_preflight_cache()
         except Exception as e:
             return _with_norm({"success": False, "message": f"Text edit conversion failed: {e}"}, normalized_for_echo, routing="mixed/text-first")
 
@@ -776,7 +778,7 @@ async def script_apply_edits(
                 params_struct,
             )
             if isinstance(resp_struct, dict) and resp_struct.get("success"):
-                pass  # Optional sentinel reload removed (deprecated)
+                invalidate_preflight_cache()
             return _with_norm(resp_struct if isinstance(resp_struct, dict) else {"success": False, "message": str(resp_struct)}, normalized_for_echo, routing="mixed/text-first")
 
         return _with_norm({"success": True, "message": "Applied text edits (no structured ops)"}, normalized_for_echo, routing="mixed/text-first")
@@ -908,7 +910,7 @@ async def script_apply_edits(
                 params,
             )
             if isinstance(resp, dict) and resp.get("success"):
-                pass  # Optional sentinel reload removed (deprecated)
+                invalidate_preflight_cache()
             return _with_norm(
                 resp if isinstance(resp, dict)
                 else {"success": False, "message": str(resp)},
@@ -997,7 +999,7 @@ async def script_apply_edits(
         params,
     )
     if isinstance(write_resp, dict) and write_resp.get("success"):
-        pass  # Optional sentinel reload removed (deprecated)
+        invalidate_preflight_cache()
     return _with_norm(
         write_resp if isinstance(write_resp, dict)
         else {"success": False, "message": str(write_resp)},
@@ -2,29 +2,48 @@
 
 from __future__ import annotations
 
+import base64
 import json
+from functools import lru_cache
 from typing import Any
 
+from utils import json_codec
+
+try:
+    import pybase64
+    HAS_PYBASE64 = True
+except ImportError:
+    pybase64 = None  # type: ignore
+    HAS_PYBASE64 = False
+
 _TRUTHY = {"true", "1", "yes", "on"}
 _FALSY = {"false", "0", "no", "off"}
 
 
 def coerce_bool(value: Any, default: bool | None = None) -> bool | None:
     """Attempt to coerce a loosely-typed value to a boolean."""
+    # Typed clients send real booleans; identity checks avoid the isinstance call.
+    if value is True or value is False:
+        return value
     if value is None:
         return default
-    if isinstance(value, bool):
-        return value
     if isinstance(value, str):
-        lowered = value.strip().lower()
-        if lowered in _TRUTHY:
-            return True
-        if lowered in _FALSY:
-            return False
-        return default
+        parsed = _parse_bool_str(value)
+        return default if parsed is None else parsed
     return bool(value)
 
 
+@lru_cache(maxsize=32)
+def _parse_bool_str(value: str) -> bool | None:
+    """Parse a boolean-like string; None if unrecognized. Clients send a handful of spellings."""
+    lowered = value.strip().lower()
+    if lowered in _TRUTHY:
+        return True
+    if lowered in _FALSY:
+        return False
+    return None
+
+
 def parse_json_payload(value: Any) -> Any:
     """
     Attempt to parse a value that might be a JSON string into its native object.
@@ -55,7 +74,7 @@ def parse_json_payload(value: Any) -> Any:
         return value
 
     try:
-        return json.loads(value)
+        return json_codec.loads(value)
     except (json.JSONDecodeError, ValueError):
         # If parsing fails, assume it was meant to be a literal string
         return value
@@ -65,11 +84,17 @@ def coerce_int(value: Any, default: int | None = None) -> int | None:
     """Attempt to coerce a loosely-typed value to an integer."""
     if value is None:
         return default
+    # Fast path: JSON numbers from MCP clients arrive as plain ints (bool is excluded by the exact type check).
+    if type(value) is int:
+        return value
     try:
         if isinstance(value, bool):
             return default
         if isinstance(value, int):
             return value
+        if isinstance(value, str):
+            parsed = _parse_int_str(value)
+            return default if parsed is None else parsed
         s = str(value).strip()
         if s.lower() in ("", "none", "null"):
             return default
@@ -78,10 +103,24 @@ def coerce_int(value: Any, default: int | None = None) -> int | None:
         return default
 
 
+@lru_cache(maxsize=128)
+def _parse_int_str(value: str) -> int | None:
+    """Parse an integer-like string; None if empty/null or not numeric. Page sizes and indices repeat."""
+    s = value.strip()
+    if s.lower() in ("", "none", "null"):
+        return None
+    try:
+        return int(float(s))
+    except (ValueError, OverflowError):
+        return None
+
+
 def coerce_float(value: Any, default: float | None = None) -> float | None:
     """Attempt to coerce a loosely-typed value to a float-like number."""
     if value is None:
         return default
+    if type(value) is float:
+        return value
     try:
         # Treat booleans as invalid numeric input instead of coercing to 0/1.
         if isinstance(value, bool):
@@ -96,6 +135,21 @@ def coerce_float(value: Any, default: float | None = None) -> float | None:
         return default
 
 
+def encode_base64_text(text: str) -> str:
+    """Base64-encode text as UTF-8 for transport to Unity, using pybase64 when it is installed."""
+    raw = text.encode("utf-8")
+    if HAS_PYBASE64:
+        return pybase64.b64encode_as_string(raw)
+    return base64.b64encode(raw).decode("ascii")
+
+
+def decode_base64_text(encoded: str | bytes, errors: str = "strict") -> str:
+    """Decode base64 contents returned by Unity back to text (UTF-8)."""
+    if HAS_PYBASE64:
+        return pybase64.b64decode(encoded).decode("utf-8", errors)
+    return base64.b64decode(encoded).decode("utf-8", errors)
+
+
 def normalize_properties(value: Any) -> tuple[dict[str, Any] | None, str | None]:
     """
     Robustly normalize a properties parameter to a dict.
@@ -16,7 +16,7 @@ from typing import Any
 
 from models.models import MCPResponse, UnityInstanceInfo
 from transport.legacy.stdio_port_registry import stdio_port_registry
-
+from utils import json_codec
 
 logger = logging.getLogger("mcp-for-unity-server")
 
@@ -27,6 +27,16 @@ _connection_lock = threading.Lock()
 FRAMED_MAX = 64 * 1024 * 1024
 
 
+def _encode_command(command_type: str, params: dict[str, Any]) -> bytes:
+    """Serialize a command envelope to UTF-8 JSON, using orjson when it is installed."""
+    return json_codec.dumps({'type': command_type, 'params': params})
+
+
+def _decode_response(data: bytes) -> Any:
+    """Parse a UTF-8 JSON reply from Unity, straight from bytes with orjson when it is installed."""
+    return json_codec.loads(data)
+
+
 @dataclass
 class UnityConnection:
     """Manages the socket connection to the Unity Editor."""
@@ -234,7 +244,11 @@ class UnityConnection:
             raise
 
     def send_command(self, command_type: str, params: dict[str, Any] = None) -> dict[str, Any]:
-        """Send a command with retry/backoff and port rediscovery. Pings only when requested."""
+        """Send a command with retry/backoff and port rediscovery. Pings only when requested.
+
+        Retries sleep for a random time in [0, min(cap, base * 2**attempt)) ("full jitter"),
+        where the cap is shorter while Unity is reloading or for refused/reset sockets.
+        """
         # Defensive guard: catch empty/placeholder invocations early
         if not command_type:
             raise ValueError("MCP call missing command_type")
@@ -306,10 +320,7 @@ class UnityConnection:
                 if command_type == 'ping':
                     payload = b'ping'
                 else:
-                    payload = json.dumps({
-                        'type': command_type,
-                        'params': params,
-                    }).encode('utf-8')
+                    payload = _encode_command(command_type, params)
 
                 # Send/receive are serialized to protect the shared socket
                 with self._io_lock:
@@ -341,12 +352,12 @@ class UnityConnection:
 
                 # Parse
                 if command_type == 'ping':
-                    resp = json.loads(response_data.decode('utf-8'))
+                    resp = _decode_response(response_data)
                     if resp.get('status') == 'success' and resp.get('result', {}).get('message') == 'pong':
                         return {"message": "pong"}
                     raise Exception("Ping unsuccessful")
 
-                resp = json.loads(response_data.decode('utf-8'))
+                resp = _decode_response(response_data)
                 if resp.get('status') == 'error':
                     err = resp.get('error') or resp.get(
                         'message', 'Unknown Unity error')
@@ -394,10 +405,6 @@ class UnityConnection:
                 if attempt < attempts:
                     # Heartbeat-aware, jittered backoff
                     status = read_status_file(target_hash)
-                    # Base exponential backoff
-                    backoff = base_backoff * (2 ** attempt)
-                    # Decorrelated jitter multiplier
-                    jitter = random.uniform(0.1, 0.3)
 
                     # Fast‑retry for transient socket failures
                     fast_error = isinstance(
@@ -418,7 +425,10 @@ class UnityConnection:
                     else:
                         cap = 3.0
 
-                    sleep_s = min(cap, jitter * (2 ** attempt))
+                    # Full jitter: callers that failed together (e.g. on a domain reload)
+                    # spread their retries over the whole window instead of reconnecting
+                    # in lockstep.
+                    sleep_s = random.random() * min(cap, base_backoff * (1 << attempt))
                     time.sleep(sleep_s)
                     continue
                 raise
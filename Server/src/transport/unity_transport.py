@@ -3,18 +3,26 @@ from __future__ import annotations
 
 import asyncio
 import inspect
+import logging
 import os
-from typing import Awaitable, Callable, TypeVar
+from typing import Any, Awaitable, Callable, TypeVar
 
 from fastmcp import Context
 
-from transport.plugin_hub import PluginHub
+from transport.plugin_hub import NoUnitySessionError, PluginDisconnectedError, PluginHub
 from models.models import MCPResponse
 from models.unity_response import normalize_unity_response
 from services.tools import get_unity_instance_from_context
 
 T = TypeVar("T")
 
+logger = logging.getLogger("mcp-for-unity-server")
+
+# Failures of the connection to Unity itself, as opposed to bugs in the calling code.
+# OSError covers ConnectionError and TimeoutError; asyncio.TimeoutError is separate before 3.11.
+_TRANSPORT_ERRORS = (OSError, asyncio.TimeoutError,
+                     PluginDisconnectedError, NoUnitySessionError)
+
 
 def _is_http_transport() -> bool:
     return os.environ.get("UNITY_MCP_TRANSPORT", "stdio").lower() == "http"
@@ -76,12 +84,41 @@ def with_unity_instance(
     return _decorate
 
 
+def _dump_response(response: MCPResponse) -> dict[str, Any]:
+    """
+    Dump an MCPResponse into a reply dict, leaving "data" out when it is None.
+
+    Resource models declare non-Optional data fields (e.g. TagsResponse.data: list[str]) and
+    tools call resp.setdefault("data", {}); an explicit None would break both on failures.
+    """
+    payload = response.model_dump()
+    if payload.get("data") is None:
+        payload.pop("data", None)
+    return payload
+
+
+def _as_response_dict(result: Any) -> dict[str, Any]:
+    """Coerce whatever a transport produced into the dict envelope tools return."""
+    if isinstance(result, dict):
+        return result
+    if isinstance(result, MCPResponse):
+        return _dump_response(result)
+    return _dump_response(
+        MCPResponse(success=False, error=str(result) or f"{type(result).__name__}")
+    )
+
+
 async def send_with_unity_instance(
-    send_fn: Callable[..., Awaitable[T]],
+    send_fn: Callable[..., Awaitable[Any]],
     unity_instance: str | None,
     *args,
     **kwargs,
-) -> T:
+) -> dict[str, Any]:
+    """Send a command to the targeted Unity instance over the active transport.
+
+    Always returns a response dict: transport failures and non-dict replies are
+    folded into a {"success": False, ...} envelope, so callers need no type checks.
+    """
     if _is_http_transport():
         if not args:
             raise ValueError("HTTP transport requires command arguments")
@@ -98,17 +135,31 @@ async def send_with_unity_instance(
                 command_type,
                 params,
             )
-            return normalize_unity_response(raw)
-        except Exception as exc:
+            return _as_response_dict(normalize_unity_response(raw))
+        except _TRANSPORT_ERRORS as exc:
             # NOTE: asyncio.TimeoutError has an empty str() by default, which is confusing for clients.
             err = str(exc) or f"{type(exc).__name__}"
             # Fail fast with a retry hint instead of hanging for COMMAND_TIMEOUT.
             # The client can decide whether retrying is appropriate for the command.
-            return normalize_unity_response(
-                MCPResponse(success=False, error=err,
-                            hint="retry").model_dump()
+            return _dump_response(
+                MCPResponse(success=False, error=err, hint="retry")
+            )
+        except Exception as exc:
+            # PluginHub reports routing problems (e.g. several instances connected, hub not
+            # configured) as plain RuntimeErrors, so these still become a failure envelope;
+            # log the traceback so genuine bugs are not hidden behind it.
+            logger.exception("Unexpected error sending '%s' to Unity", command_type)
+            err = str(exc) or f"{type(exc).__name__}"
+            return _dump_response(
+                MCPResponse(success=False, error=err, hint="retry")
             )
 
     if unity_instance:
         kwargs.setdefault("instance_id", unity_instance)
-    return await send_fn(*args, **kwargs)
+    try:
+        return _as_response_dict(await send_fn(*args, **kwargs))
+    except _TRANSPORT_ERRORS as exc:
+        # Own the failure envelope here so tools don't each need a catch-all around the send;
+        # anything else is a bug and propagates.
+        err = str(exc) or f"{type(exc).__name__}"
+        return _dump_response(MCPResponse(success=False, error=err))
@@ -0,0 +1,72 @@
+"""
+JSON encode/decode helpers shared by the transport and tools.
+
+Uses orjson when it happens to be installed (it is not a declared dependency; pip install
+orjson to opt in) and the standard library json module otherwise. Results match json:
+inputs orjson would handle differently (integers wider than 64 bits, NaN/Infinity) are
+routed through json.
+"""
+from __future__ import annotations
+
+import json
+import math
+import re
+from typing import Any
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None  # type: ignore
+    HAS_ORJSON = False
+
+# orjson reads integers wider than 64 bits as floats, silently dropping precision. A run of
+# 19+ digits may be such an integer (int64 max has 19 digits), so that text goes through json,
+# which keeps exact ints. Digits inside strings match too; json then parses them identically.
+_LONG_DIGITS_STR_RE = re.compile(r"\d{19}")
+_LONG_DIGITS_BYTES_RE = re.compile(rb"\d{19}")
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse JSON text or UTF-8 bytes. Raises json.JSONDecodeError (a ValueError) on invalid input."""
+    if isinstance(data, str):
+        if HAS_ORJSON and not _LONG_DIGITS_STR_RE.search(data):
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                # orjson is stricter than json (e.g. bare NaN/Infinity tokens); let json decide.
+                pass
+        return json.loads(data)
+    if HAS_ORJSON and not _LONG_DIGITS_BYTES_RE.search(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data.decode("utf-8"))
+
+
+def _has_non_finite(obj: Any) -> bool:
+    """Return True if obj contains a NaN or infinite float at any depth."""
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, float):
+            if not math.isfinite(item):
+                return True
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return False
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes."""
+    # orjson writes NaN/Infinity as null; json keeps the NaN/Infinity tokens, which Unity parses.
+    if HAS_ORJSON and not _has_non_finite(obj):
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # orjson rejects some values json accepts (e.g. ints beyond 64 bits); fall back below.
+            pass
+    return json.dumps(obj).encode("utf-8")
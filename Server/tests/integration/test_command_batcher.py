@@ -0,0 +1,82 @@
+import asyncio
+
+import pytest
+
+from services.tools.command_batcher import CommandBatcher
+
+
+def _fake_unity(calls):
+    async def fake_send(cmd, params, **kwargs):
+        calls.append(cmd)
+        if cmd == "batch_execute":
+            results = [
+                {"tool": c["tool"], "callSucceeded": True,
+                    "result": {"success": True, "data": c["params"]["n"]}}
+                for c in params["commands"]
+            ]
+            return {"success": True, "data": {"results": results}}
+        return {"success": True, "data": params["n"]}
+
+    return fake_send
+
+
+@pytest.mark.asyncio
+async def test_batcher_sends_directly_when_window_disabled(monkeypatch):
+    monkeypatch.delenv("UNITY_MCP_BATCH_WINDOW_MS", raising=False)
+    calls = []
+
+    resp = await CommandBatcher("manage_gameobject").send(_fake_unity(calls), None, {"n": 1})
+
+    assert resp == {"success": True, "data": 1}
+    assert calls == ["manage_gameobject"]
+
+
+@pytest.mark.asyncio
+async def test_batcher_coalesces_concurrent_calls(monkeypatch):
+    monkeypatch.setenv("UNITY_MCP_BATCH_WINDOW_MS", "5")
+    calls = []
+    batcher = CommandBatcher("manage_gameobject")
+    send = _fake_unity(calls)
+
+    results = await asyncio.gather(*[batcher.send(send, None, {"n": i}) for i in range(3)])
+
+    assert [r["data"] for r in results] == [0, 1, 2]
+    assert calls == ["batch_execute"]
+
+
+async def _gather_batched(monkeypatch, fake_send, count=3):
+    monkeypatch.setenv("UNITY_MCP_BATCH_WINDOW_MS", "5")
+    batcher = CommandBatcher("manage_gameobject")
+    return await asyncio.gather(*[batcher.send(fake_send, None, {"n": i}) for i in range(count)])
+
+
+@pytest.mark.asyncio
+async def test_batcher_gives_each_caller_its_own_batch_failure(monkeypatch):
+    async def fake_send(cmd, params, **kwargs):
+        return {"success": False, "error": "Unity is reloading"}
+
+    results = await _gather_batched(monkeypatch, fake_send)
+
+    assert all(r == {"success": False, "error": "Unity is reloading"} for r in results)
+    results[0]["message"] = "changed"
+    assert "message" not in results[1]
+
+
+@pytest.mark.asyncio
+async def test_batcher_reports_entry_errors_and_missing_entries(monkeypatch):
+    async def fake_send(cmd, params, **kwargs):
+        results = [
+            {"tool": "manage_gameobject", "callSucceeded": False, "error": "Target not found"},
+            {"tool": "manage_gameobject", "callSucceeded": True, "result": "not a dict"},
+        ]
+        return {"success": True, "data": {"results": results}}
+
+    results = await _gather_batched(monkeypatch, fake_send)
+
+    assert results[0] == {"success": False, "message": "Target not found"}
+    # Non-dict handler output is coerced into a failure envelope, as for unbatched sends
+    assert results[1]["success"] is False
+    assert results[1]["error"] == "not a dict"
+    # Unity returned fewer results than commands
+    assert results[2]["success"] is False
+    assert results[2]["message"] == "Command was not executed by batch_execute."
@@ -86,6 +86,48 @@ async def test_normalizes_lsp_and_index_ranges(monkeypatch):
     # last call is apply_text_edits
 
 
+@pytest.mark.asyncio
+async def test_read_only_issued_for_index_ranges(monkeypatch):
+    tools = setup_tools()
+    apply = tools["apply_text_edits"]
+    actions = []
+
+    async def fake_send(cmd, params, **kwargs):
+        actions.append(params.get("action"))
+        if params.get("action") == "read":
+            return {"success": True, "data": {"contents": "ab\ncd\n"}}
+        return {"success": True}
+
+    import transport.legacy.unity_connection
+    monkeypatch.setattr(
+        transport.legacy.unity_connection,
+        "async_send_command_with_retry",
+        fake_send,
+    )
+
+    # Explicit and LSP-style edits need no file contents
+    await apply(
+        DummyContext(),
+        uri="mcpforunity://path/Assets/Scripts/F.cs",
+        edits=[
+            {"startLine": 1, "startCol": 1, "endLine": 1, "endCol": 1, "text": "x"},
+            {"range": {"start": {"line": 1, "character": 0}, "end": {"line": 1, "character": 0}}, "newText": "y"},
+        ],
+        precondition_sha256="x",
+    )
+    assert actions == ["apply_text_edits"]
+
+    # Index ranges read the file once, however many there are
+    actions.clear()
+    await apply(
+        DummyContext(),
+        uri="mcpforunity://path/Assets/Scripts/F.cs",
+        edits=[{"range": [0, 1], "text": "A"}, {"range": [3, 4], "text": "C"}],
+        precondition_sha256="x",
+    )
+    assert actions == ["read", "apply_text_edits"]
+
+
 @pytest.mark.asyncio
 async def test_noop_evidence_shape(monkeypatch):
     tools = setup_tools()
@@ -84,3 +84,44 @@ async def test_strict_zero_based_error(monkeypatch):
     )
     assert resp["success"] is False
     assert resp.get("code") == "zero_based_explicit_fields"
+
+
+@pytest.mark.asyncio
+async def test_strict_zero_based_error_reports_edits_normalized_so_far(monkeypatch):
+    tools = setup_tools()
+    apply_edits = tools["apply_text_edits"]
+
+    async def fake_send(cmd, params, **kwargs):
+        return {"success": True}
+
+    import transport.legacy.unity_connection
+    monkeypatch.setattr(
+        transport.legacy.unity_connection,
+        "async_send_command_with_retry",
+        fake_send,
+    )
+
+    # An LSP range ahead of the bad explicit edit makes this a mixed list
+    lsp = {"range": {"start": {"line": 2, "character": 4}, "end": {"line": 2, "character": 4}},
+           "newText": "a"}
+    bad = {"startLine": 0, "startCol": 1,
+           "endLine": 1, "endCol": 1, "newText": "b"}
+    resp = await apply_edits(
+        DummyContext(),
+        uri="mcpforunity://path/Assets/Scripts/F.cs",
+        edits=[lsp, bad],
+        strict=True,
+    )
+    assert resp["success"] is False
+    assert resp.get("code") == "zero_based_explicit_fields"
+    assert resp["data"]["normalizedEdits"] == [
+        {"startLine": 3, "startCol": 5, "endLine": 3, "endCol": 5, "newText": "a"}]
+
+    # Without any edit needing normalization, the offending edit itself is reported
+    resp = await apply_edits(
+        DummyContext(),
+        uri="mcpforunity://path/Assets/Scripts/F.cs",
+        edits=[bad],
+        strict=True,
+    )
+    assert resp["data"]["normalizedEdits"] == [bad]
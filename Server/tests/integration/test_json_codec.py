@@ -0,0 +1,57 @@
+import json
+
+import pytest
+
+from utils import json_codec
+from services.tools.utils import parse_json_payload
+from transport.legacy.unity_connection import _decode_response, _encode_command
+
+_PAYLOADS = (
+    '{"a": 1, "b": [1.5, "x", null, true], "c": {"d": -7}}',
+    '{"big": 12345678901234567890123, "nested": {"ids": [18446744073709551616]}}',
+    '{"text": "\\u00e9\\u4e2d"}',
+)
+
+
+@pytest.fixture(params=("orjson", "json"))
+def codec_backend(request, monkeypatch):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(json_codec, "HAS_ORJSON", False)
+    return request.param
+
+
+@pytest.mark.parametrize("payload", _PAYLOADS)
+def test_loads_matches_stdlib_json(codec_backend, payload):
+    expected = json.loads(payload)
+    assert json_codec.loads(payload) == expected
+    assert json_codec.loads(payload.encode("utf-8")) == expected
+    assert parse_json_payload(payload) == expected
+
+
+def test_wide_integers_keep_exact_value(codec_backend):
+    parsed = parse_json_payload('{"a": 12345678901234567890123}')
+    assert parsed == {"a": 12345678901234567890123}
+    assert isinstance(parsed["a"], int)
+
+
+def test_command_envelope_round_trips(codec_backend):
+    params = {"n": 2 ** 70, "xs": [1, 2.5], "s": "é"}
+    encoded = _encode_command("ping", params)
+    assert isinstance(encoded, bytes)
+    assert _decode_response(encoded) == {"type": "ping", "params": params}
+
+
+def test_non_finite_floats_are_sent_as_json_tokens(codec_backend):
+    value = parse_json_payload('[1, NaN, Infinity, -Infinity]')
+    encoded = _encode_command("set", {"value": value, "nested": {"v": [float("nan")]}})
+    assert b"null" not in encoded
+    assert encoded == json.dumps(
+        {"type": "set", "params": {"value": value, "nested": {"v": [float("nan")]}}}).encode("utf-8")
+
+
+def test_invalid_json_raises_value_error(codec_backend):
+    with pytest.raises(ValueError):
+        json_codec.loads('{"a": ')
+    assert parse_json_payload('{"a": ') == '{"a": '
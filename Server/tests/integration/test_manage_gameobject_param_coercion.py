@@ -63,3 +63,13 @@ async def test_manage_gameobject_create_with_tag(monkeypatch):
     assert p["name"] == "TestObject"
     assert p["tag"] == "Player"
     assert p["position"] == [1.0, 2.0, 3.0]
+
+
+def test_normalize_vector_legacy_string_split_rules():
+    """Legacy vector strings split on ',' when present, else whitespace; empty parts are rejected."""
+    normalize = manage_go_mod._normalize_vector
+    assert normalize("1,2,3") == [1.0, 2.0, 3.0]
+    assert normalize("1 2 3") == [1.0, 2.0, 3.0]
+    assert normalize("[1, 2, 3]") == [1.0, 2.0, 3.0]
+    assert normalize("1,,2,3") is None
+    assert normalize("1,2 3") is None
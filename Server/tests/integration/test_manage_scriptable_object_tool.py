@@ -127,4 +127,29 @@ def test_manage_scriptable_object_dry_run_string_coercion(monkeypatch):
     assert captured["params"]["dryRun"] is True
 
 
+def test_manage_scriptable_object_dry_run_leaves_patch_validation_to_unity(monkeypatch):
+    captured = {}
+
+    async def fake_async_send(cmd, params, **kwargs):
+        captured["params"] = params
+        return {"success": True, "data": {"dryRun": True, "valid": False, "validationResults": []}}
+
+    monkeypatch.setattr(mod, "async_send_command_with_retry", fake_async_send)
 
+    ctx = DummyContext()
+    ctx.set_state("unity_instance", "UnityMCPTests@dummy")
+
+    result = asyncio.run(
+        mod.manage_scriptable_object(
+            ctx=ctx,
+            action="modify",
+            target={"guid": "abc"},
+            patches='[{"propertyPath":"myInt","op":"set","value":1},{"op":"set","value":2}]',
+            dry_run=True,
+        )
+    )
+
+    # Per-patch results (and target resolution) come from Unity's dry run, not a local short-circuit.
+    assert result["success"] is True
+    assert captured["params"]["dryRun"] is True
+    assert captured["params"]["patches"][1] == {"op": "set", "value": 2}
@@ -0,0 +1,117 @@
+import asyncio
+import base64
+from array import array
+
+from .test_helpers import DummyContext
+import services.tools.manage_vfx as mod
+
+
+def test_manage_vfx_batch_sends_single_batch_execute(monkeypatch):
+    captured = []
+
+    async def fake_async_send(cmd, params, **kwargs):
+        captured.append((cmd, params))
+        return {"success": True, "data": {"results": []}}
+
+    monkeypatch.setattr(mod, "async_send_command_with_retry", fake_async_send)
+
+    ctx = DummyContext()
+    ctx.set_state("unity_instance", "UnityMCPTests@dummy")
+
+    result = asyncio.run(
+        mod.manage_vfx(
+            ctx=ctx,
+            action="batch",
+            target="Fire",
+            actions='[{"action":"particle_set_main","duration":2},{"action":"particle_play","target":"Smoke"}]',
+        )
+    )
+
+    assert result["success"] is True
+    assert len(captured) == 1
+    cmd, params = captured[0]
+    assert cmd == "batch_execute"
+    assert params["normalizeKeys"] is False
+    assert [c["params"] for c in params["commands"]] == [
+        {"action": "particle_set_main", "target": "Fire", "duration": 2},
+        {"action": "particle_play", "target": "Smoke"},
+    ]
+
+
+def test_manage_vfx_batch_rejects_unknown_sub_action(monkeypatch):
+    async def fake_async_send(cmd, params, **kwargs):
+        raise AssertionError("invalid batches should not reach Unity")
+
+    monkeypatch.setattr(mod, "async_send_command_with_retry", fake_async_send)
+
+    result = asyncio.run(
+        mod.manage_vfx(
+            ctx=DummyContext(),
+            action="batch",
+            actions=[{"action": "particle_play"}, {"action": "particle_explode"}],
+        )
+    )
+
+    assert result["success"] is False
+    assert "actions[1]" in result["message"]
+
+
+def test_manage_vfx_packs_long_position_lists(monkeypatch):
+    monkeypatch.setenv("UNITY_MCP_PACK_LINE_POSITIONS", "1")
+    captured = {}
+
+    async def fake_async_send(cmd, params, **kwargs):
+        captured["params"] = params
+        return {"success": True}
+
+    monkeypatch.setattr(mod, "async_send_command_with_retry", fake_async_send)
+
+    positions = [[i, i * 0.5, -i] for i in range(100)]
+    asyncio.run(mod.manage_vfx(ctx=DummyContext(), action="line_set_positions",
+                target="Line", positions=positions))
+
+    params = captured["params"]
+    assert "positions" not in params
+    floats = array("f")
+    floats.frombytes(base64.b64decode(params["positionsBin"]))
+    assert floats.tolist() == [c for p in positions for c in p]
+
+
+def test_manage_vfx_sends_plain_positions_by_default(monkeypatch):
+    # Older Unity packages only read 'positions'; packing must be opted into.
+    monkeypatch.delenv("UNITY_MCP_PACK_LINE_POSITIONS", raising=False)
+    captured = {}
+
+    async def fake_async_send(cmd, params, **kwargs):
+        captured["params"] = params
+        return {"success": True}
+
+    monkeypatch.setattr(mod, "async_send_command_with_retry", fake_async_send)
+
+    positions = [[i, i * 0.5, -i] for i in range(100)]
+    asyncio.run(mod.manage_vfx(ctx=DummyContext(), action="line_set_positions",
+                target="Line", positions=positions))
+
+    params = captured["params"]
+    assert "positionsBin" not in params
+    assert params["positions"] == positions
+
+
+def test_manage_vfx_sends_plain_positions_when_packing_overflows(monkeypatch):
+    monkeypatch.setenv("UNITY_MCP_PACK_LINE_POSITIONS", "1")
+    captured = {}
+
+    async def fake_async_send(cmd, params, **kwargs):
+        captured["params"] = params
+        return {"success": True}
+
+    monkeypatch.setattr(mod, "async_send_command_with_retry", fake_async_send)
+
+    # 10**400 does not fit in a float32, so the list cannot be packed
+    positions = [[i, 0, 0] for i in range(99)] + [[10 ** 400, 0, 0]]
+    asyncio.run(mod.manage_vfx(ctx=DummyContext(), action="line_set_positions",
+                target="Line", positions=positions))
+
+    params = captured["params"]
+    assert "positionsBin" not in params
+    assert params["positions"] == positions
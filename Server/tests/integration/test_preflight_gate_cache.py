@@ -0,0 +1,94 @@
+import pytest
+
+from models import MCPResponse
+
+from .test_helpers import DummyContext
+
+
+@pytest.mark.asyncio
+async def test_preflight_reuses_recent_pass_and_invalidates(monkeypatch):
+    """A passed gate is shared by back-to-back tool calls until invalidated."""
+    import services.tools.preflight as preflight_mod
+    import services.resources.editor_state as editor_state_mod
+
+    # preflight is a no-op under pytest; force the real path.
+    monkeypatch.setattr(preflight_mod, "_in_pytest", lambda: False)
+    preflight_mod.invalidate_preflight_cache()
+
+    calls = {"n": 0}
+
+    async def fake_get_editor_state(ctx):
+        calls["n"] += 1
+        return MCPResponse(success=True, data={"compilation": {"is_compiling": False}})
+
+    monkeypatch.setattr(editor_state_mod, "get_editor_state", fake_get_editor_state)
+
+    ctx = DummyContext()
+    ctx.set_state("unity_instance", "UnityMCPTests@cc8756d4cce0805a")
+
+    assert await preflight_mod.preflight(ctx, wait_for_no_compile=True) is None
+    assert await preflight_mod.preflight(ctx, wait_for_no_compile=True) is None
+    assert calls["n"] == 1
+
+    preflight_mod.invalidate_preflight_cache()
+    assert await preflight_mod.preflight(ctx, wait_for_no_compile=True) is None
+    assert calls["n"] == 2
+
+
+@pytest.mark.asyncio
+async def test_preflight_gates_share_recent_editor_state(monkeypatch):
+    """Different gates within the state TTL reuse one editor_state fetch."""
+    import services.tools.preflight as preflight_mod
+    import services.resources.editor_state as editor_state_mod
+
+    monkeypatch.setattr(preflight_mod, "_in_pytest", lambda: False)
+    preflight_mod.invalidate_preflight_cache()
+
+    calls = {"n": 0}
+
+    async def fake_get_editor_state(ctx):
+        calls["n"] += 1
+        return MCPResponse(success=True, data={"tests": {"is_running": False}})
+
+    monkeypatch.setattr(editor_state_mod, "get_editor_state", fake_get_editor_state)
+
+    ctx = DummyContext()
+    assert await preflight_mod.preflight(ctx, wait_for_no_compile=True) is None
+    assert await preflight_mod.preflight(ctx, requires_no_tests=True) is None
+    assert calls["n"] == 1
+
+
+@pytest.mark.asyncio
+async def test_preflight_not_served_from_cache_after_script_write(monkeypatch):
+    """A script write can start a compile, so the next gate re-reads editor state."""
+    import services.tools.preflight as preflight_mod
+    import services.resources.editor_state as editor_state_mod
+    import transport.legacy.unity_connection
+    from services.tools.manage_script import apply_text_edits
+
+    monkeypatch.setattr(preflight_mod, "_in_pytest", lambda: False)
+    preflight_mod.invalidate_preflight_cache()
+
+    calls = {"n": 0}
+
+    async def fake_get_editor_state(ctx):
+        calls["n"] += 1
+        return MCPResponse(success=True, data={"compilation": {"is_compiling": False}})
+
+    async def fake_send(cmd, params, **kwargs):
+        return {"success": True}
+
+    monkeypatch.setattr(editor_state_mod, "get_editor_state", fake_get_editor_state)
+    monkeypatch.setattr(
+        transport.legacy.unity_connection, "async_send_command_with_retry", fake_send)
+
+    ctx = DummyContext()
+    assert await preflight_mod.preflight(ctx, wait_for_no_compile=True) is None
+    assert calls["n"] == 1
+
+    edit = {"startLine": 1, "startCol": 1, "endLine": 1, "endCol": 1, "newText": "//x\n"}
+    resp = await apply_text_edits(ctx, "mcpforunity://path/Assets/Scripts/A.cs", [edit])
+    assert resp["success"] is True
+
+    assert await preflight_mod.preflight(ctx, wait_for_no_compile=True) is None
+    assert calls["n"] == 2
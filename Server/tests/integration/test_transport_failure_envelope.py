@@ -0,0 +1,59 @@
+import pytest
+
+from models import MCPResponse
+
+from .test_helpers import DummyContext
+
+
+async def _failed_send(cmd, params, **kwargs):
+    # What async_send_command_with_retry returns when the bridge is unreachable.
+    return MCPResponse(success=False, error="Could not connect to Unity")
+
+
+@pytest.mark.asyncio
+async def test_resource_survives_failed_send(monkeypatch):
+    import services.resources.tags as tags_mod
+
+    monkeypatch.setattr(tags_mod, "async_send_command_with_retry", _failed_send)
+
+    resp = await tags_mod.get_tags(DummyContext())
+    assert resp.success is False
+    assert resp.error == "Could not connect to Unity"
+
+
+@pytest.mark.asyncio
+async def test_apply_text_edits_survives_failed_send(monkeypatch):
+    import transport.legacy.unity_connection
+    from services.tools.manage_script import apply_text_edits
+
+    monkeypatch.setattr(
+        transport.legacy.unity_connection,
+        "async_send_command_with_retry",
+        _failed_send,
+    )
+
+    edit = {"startLine": 1, "startCol": 0, "endLine": 1,
+            "endCol": 0, "newText": "//header\n"}
+    resp = await apply_text_edits(
+        DummyContext(), "mcpforunity://path/Assets/Scripts/File.cs", [edit])
+    assert resp["success"] is False
+    assert resp["error"] == "Could not connect to Unity"
+    assert resp["data"]["normalizedEdits"][0]["newText"] == "//header\n"
+
+
+@pytest.mark.asyncio
+async def test_send_converts_transport_errors_only():
+    from transport.unity_transport import send_with_unity_instance
+
+    async def refused(cmd, params, **kwargs):
+        raise ConnectionRefusedError("Connection refused")
+
+    async def buggy(cmd, params, **kwargs):
+        raise TypeError("bad argument")
+
+    resp = await send_with_unity_instance(refused, None, "ping", {})
+    assert resp["success"] is False
+    assert resp["error"] == "Connection refused"
+
+    with pytest.raises(TypeError):
+        await send_with_unity_instance(buggy, None, "ping", {})